@@ -111,6 +111,13 @@ Memory Requirements:
         help="Days ahead to scrape (default: 30)"
     )
     
+    parser.add_argument(
+        "--date-pages",
+        type=int,
+        default=1,
+        help="Dates scraped in parallel per hotel, one page each (default: 1)"
+    )
+    
     parser.add_argument(
         "--limit", "-l",
         type=int,
@@ -201,6 +208,7 @@ Memory Requirements:
         location="Jaipur",
         days_ahead=args.days,
         num_hotels=len(hotels),
+        concurrency=args.date_pages,
     )
     
     # Calculate estimates
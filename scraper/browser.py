@@ -3,7 +3,8 @@
 import asyncio
 import logging
 import random
-from typing import Optional
+from typing import Any, Awaitable, Callable, Optional, Sequence
+from urllib.parse import urlparse
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
 
 logger = logging.getLogger(__name__)
@@ -25,12 +26,147 @@ VIEWPORTS = [
     {"width": 1440, "height": 900},
 ]
 
+# Flags that hide automation from the site; every launch uses them
+STEALTH_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-infobars",
+    "--window-position=0,0",
+    "--ignore-certificate-errors",
+    "--ignore-certificate-errors-spki-list",
+]
+
+# Subsystems the scrapers never use; switching them off trims memory and startup time.
+# The backgrounding flags keep pages that aren't in front (concurrent dates) at full speed.
+LEAN_ARGS = [
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-features=TranslateUI",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--mute-audio",
+]
+
+LAUNCH_ARGS = STEALTH_ARGS + LEAN_ARGS
+
+# Added when images are blocked anyway: Blink skips image decoding entirely
+NO_IMAGES_ARG = "--blink-settings=imagesEnabled=false"
+
+# Resource types the scrapers never read; aborting them saves bandwidth and render time
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+# Third-party tracking/ads hosts that only add requests (matched against the request's
+# hostname, including subdomains)
+BLOCKED_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "facebook.net",
+    "connect.facebook.com",
+    "hotjar.com",
+    "criteo.com",
+    "bing.com",
+)
+
+
+# Routed contexts bypass the browser's HTTP cache, so static scripts are cached here
+# (url -> (status, headers, body)); shared by every routed context in the process
+_STATIC_CACHE: dict[str, tuple[int, dict, bytes]] = {}
+_STATIC_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_static_cache_bytes = 0
+_UNCACHEABLE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "set-cookie"})
+
+
+def _is_blocked_host(url: str) -> bool:
+    """Check whether a URL's host is one of BLOCKED_DOMAINS or a subdomain of one."""
+    host = urlparse(url).hostname or ""
+    return any(host == domain or host.endswith("." + domain) for domain in BLOCKED_DOMAINS)
+
+
+async def _fulfill_static(route, request):
+    """Serve a static script from the in-memory cache, fetching and storing it on a miss."""
+    global _static_cache_bytes
+    cached = _STATIC_CACHE.get(request.url)
+    if cached:
+        status, headers, body = cached
+        await route.fulfill(status=status, headers=headers, body=body)
+        return
+    
+    response = await route.fetch()
+    body = await response.body()
+    headers = response.headers
+    if (
+        response.status == 200
+        and "no-store" not in headers.get("cache-control", "")
+        and _static_cache_bytes + len(body) <= _STATIC_CACHE_MAX_BYTES
+    ):
+        # Concurrent misses for one URL all land here; count the bytes of a replaced entry once
+        replaced = _STATIC_CACHE.get(request.url)
+        _STATIC_CACHE[request.url] = (
+            200,
+            {k: v for k, v in headers.items() if k.lower() not in _UNCACHEABLE_HEADERS},
+            body,
+        )
+        _static_cache_bytes += len(body) - (len(replaced[2]) if replaced else 0)
+    await route.fulfill(response=response, body=body)
+
+
+async def _route_blocked_resources(route):
+    """Abort heavy or tracking requests, serve cached scripts and let everything else through."""
+    request = route.request
+    try:
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or _is_blocked_host(request.url):
+            await route.abort()
+        elif (
+            request.resource_type == "script"
+            and request.method == "GET"
+            and request.url.split("?", 1)[0].endswith(".js")
+        ):
+            await _fulfill_static(route, request)
+        else:
+            await route.continue_()
+    except Exception as e:
+        # Page/context closed while the request was in flight: nothing left to answer
+        if "has been closed" in str(e):
+            return
+        # Anything else (fetch/fulfill failed): hand the request to the network so the
+        # page doesn't hang on it until the navigation times out
+        logger.debug(f"Route handler failed for {request.url}: {e}")
+        try:
+            await route.continue_()
+        except Exception:
+            pass
+
+
+async def block_heavy_resources(context: BrowserContext):
+    """
+    Route every request of a context through a filter that drops images, media,
+    fonts, stylesheets and analytics.
+    
+    Routing disables the browser's HTTP cache for the context, so .js bundles
+    are kept in a process-wide in-memory cache instead: the first navigation
+    fetches them and later dates/hotels are served without touching the network.
+    
+    Args:
+        context: Browser context to install the route on
+    """
+    await context.route("**/*", _route_blocked_resources)
+
 
 class BrowserManager:
     """Manages Playwright browser instance with anti-detection features."""
 
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, block_resources: bool = False, cdp_endpoint: Optional[str] = None):
         self.headless = headless
+        self.block_resources = block_resources
+        self.cdp_endpoint = cdp_endpoint  # attach to a running browser (see browser_pool) instead of launching
         self.playwright: Optional[Playwright] = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
@@ -42,20 +178,16 @@ class BrowserManager:
         """Initialize browser and return page instance."""
         self.playwright = await async_playwright().start()
         
-        # Launch browser with anti-detection args
-        self.browser = await self.playwright.chromium.launch(
-            headless=self.headless,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--disable-dev-shm-usage",
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-                "--disable-infobars",
-                "--window-position=0,0",
-                "--ignore-certificate-errors",
-                "--ignore-certificate-errors-spki-list",
-            ]
-        )
+        if self.cdp_endpoint:
+            # Shared long-lived browser: skip the cold start, only the context below is ours
+            self.browser = await self.playwright.chromium.connect_over_cdp(self.cdp_endpoint)
+            logger.info(f"Attached to browser at {self.cdp_endpoint}")
+        else:
+            # Launch browser with anti-detection args
+            self.browser = await self.playwright.chromium.launch(
+                headless=self.headless,
+                args=LAUNCH_ARGS + ([NO_IMAGES_ARG] if self.block_resources else []),
+            )
 
         # Create context with realistic fingerprint
         self.context = await self.browser.new_context(
@@ -83,6 +215,9 @@ class BrowserManager:
             };
         """)
 
+        if self.block_resources:
+            await block_heavy_resources(self.context)
+
         self.page = await self.context.new_page()
         
         # Set default timeouts
@@ -113,6 +248,80 @@ async def random_delay(min_seconds: float, max_seconds: float):
     await asyncio.sleep(delay)
 
 
+async def run_on_page_pool(
+    context: BrowserContext,
+    jobs: Sequence,
+    run_job: Callable[[Page, Any], Awaitable],
+    on_done: Callable[[int, Any, Optional[Exception]], bool],
+    concurrency: int,
+    delay_range: Optional[tuple[float, float]] = None,
+):
+    """
+    Run run_job(page, job) for every job with at most `concurrency` in flight.
+    
+    A sliding window over a pool of pages: as soon as one job finishes the next
+    one starts on the freed page. Each job has its page to itself while it runs;
+    pages are reused across jobs and closed at the end, after every job still
+    running has been cancelled and awaited.
+    
+    Args:
+        context: Browser context to open pages in
+        jobs: Job arguments, passed to run_job one at a time
+        run_job: Coroutine function run as run_job(page, job)
+        on_done: Called in completion order with (index, result, error); error is
+                 the exception the job raised (result is None then). Returning True
+                 stops the window and cancels the jobs still running or waiting;
+                 raising stops it the same way and propagates.
+        concurrency: Maximum number of pages in use at the same time
+        delay_range: Optional (min, max) seconds of jitter before every job but the
+                     first, so concurrent pages don't hit the site in lockstep
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    idle_pages: list[Page] = []  # pages free for the next job
+    all_pages: list[Page] = []
+    
+    async def run(index: int, job):
+        async with semaphore:
+            if delay_range and index > 0:
+                await random_delay(*delay_range)
+            if idle_pages:
+                page = idle_pages.pop()
+            else:
+                page = await context.new_page()
+                all_pages.append(page)
+            try:
+                return await run_job(page, job)
+            finally:
+                if not page.is_closed():
+                    idle_pages.append(page)
+    
+    tasks = {asyncio.ensure_future(run(index, job)): index for index, job in enumerate(jobs)}
+    pending = set(tasks)
+    try:
+        stop = False
+        while pending and not stop:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                try:
+                    result = task.result()
+                except Exception as e:
+                    if on_done(tasks[task], None, e):
+                        stop = True
+                else:
+                    if on_done(tasks[task], result, None):
+                        stop = True
+    finally:
+        # Nothing may still be using a page when the pool is closed
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        for page in all_pages:
+            try:
+                await page.close()
+            except Exception:
+                pass
+
+
 async def scroll_to_bottom(
     page: Page,
     scroll_pause_range: tuple[float, float] = (0.5, 1.5),
@@ -143,8 +352,7 @@ async def scroll_to_bottom(
         
         # Check if we've reached target count
         if target_count and count_selector:
-            elements = await page.query_selector_all(count_selector)
-            current_count = len(elements)
+            current_count = await page.locator(count_selector).count()
             if current_count >= target_count:
                 logger.debug(f"Reached target count: {current_count} >= {target_count}")
                 return current_count
@@ -172,8 +380,8 @@ async def scroll_to_bottom(
                 if final_height == new_height:
                     # One last check for elements
                     if target_count and count_selector:
-                        elements = await page.query_selector_all(count_selector)
-                        logger.debug(f"Final scroll: Found {len(elements)} elements")
+                        final_count = await page.locator(count_selector).count()
+                        logger.debug(f"Final scroll: Found {final_count} elements")
                     break
         else:
             no_change_count = 0
@@ -181,10 +389,9 @@ async def scroll_to_bottom(
         last_height = new_height
         scroll_count += 1
     
-    # Return element count if selector provided
+    # Return element count if selector provided (counted in the page, no element handles)
     if count_selector:
-        elements = await page.query_selector_all(count_selector)
-        return len(elements)
+        return await page.locator(count_selector).count()
     
     return scroll_count
 
@@ -0,0 +1,194 @@
+"""
+Persistent Chromium process that scraper runs attach to over CDP.
+
+Launching Chromium dominates the runtime of short runs. Start the daemon once:
+
+    python -m scraper.browser_pool --port 9222
+
+and point runs at it (``--cdp-endpoint http://127.0.0.1:9222``, or
+``--cdp-endpoint auto`` to start/reuse it on the default port). Each run opens
+its own browser context in the shared process and closes it when done. The
+daemon shuts Chromium down after ``--idle-timeout`` seconds with no open pages.
+"""
+
+import argparse
+import asyncio
+import logging
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from typing import Optional
+
+import orjson
+from playwright.async_api import async_playwright
+
+from .browser import LAUNCH_ARGS
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CDP_PORT = 9222
+DEFAULT_IDLE_TIMEOUT = 600  # seconds without open pages before the daemon exits
+
+
+def cdp_endpoint_for(port: int) -> str:
+    """HTTP endpoint of a CDP browser listening on localhost:port."""
+    return f"http://127.0.0.1:{port}"
+
+
+def probe_endpoint(endpoint: str, timeout: float = 1.0) -> Optional[str]:
+    """
+    Check whether a CDP browser answers at an endpoint.
+
+    Blocking; run it via asyncio.to_thread from async code.
+
+    Args:
+        endpoint: HTTP endpoint, e.g. http://127.0.0.1:9222
+        timeout: Seconds to wait for the answer
+
+    Returns:
+        The browser's websocket debugger URL, or None if nothing answers
+    """
+    try:
+        with urllib.request.urlopen(f"{endpoint}/json/version", timeout=timeout) as response:
+            return orjson.loads(response.read()).get("webSocketDebuggerUrl")
+    except Exception:
+        return None
+
+
+def count_open_pages(endpoint: str) -> int:
+    """Number of non-blank page targets in the browser (blocking)."""
+    try:
+        with urllib.request.urlopen(f"{endpoint}/json/list", timeout=2.0) as response:
+            targets = orjson.loads(response.read())
+    except Exception:
+        return 0
+    return sum(1 for t in targets if t.get("type") == "page" and t.get("url") != "about:blank")
+
+
+async def ensure_browser_daemon(
+    port: int = DEFAULT_CDP_PORT,
+    headless: bool = True,
+    idle_timeout: int = DEFAULT_IDLE_TIMEOUT,
+    startup_timeout: float = 30.0,
+) -> str:
+    """
+    Return the endpoint of a running browser daemon, starting one if none answers.
+
+    The daemon is started detached, so it outlives this process and later runs
+    reuse it until it goes idle.
+
+    Args:
+        port: Remote debugging port
+        headless: Whether a newly started browser runs headless
+        idle_timeout: Idle seconds before a newly started daemon exits
+        startup_timeout: Seconds to wait for a new daemon to answer
+
+    Returns:
+        CDP endpoint to pass to chromium.connect_over_cdp
+    """
+    endpoint = cdp_endpoint_for(port)
+    if await asyncio.to_thread(probe_endpoint, endpoint):
+        logger.info(f"[Browser Pool] Reusing browser at {endpoint}")
+        return endpoint
+
+    command = [
+        sys.executable, "-m", "scraper.browser_pool",
+        "--port", str(port),
+        "--idle-timeout", str(idle_timeout),
+    ]
+    if not headless:
+        command.append("--no-headless")
+    subprocess.Popen(
+        command,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    deadline = time.monotonic() + startup_timeout
+    while time.monotonic() < deadline:
+        if await asyncio.to_thread(probe_endpoint, endpoint):
+            logger.info(f"[Browser Pool] Started browser daemon at {endpoint}")
+            return endpoint
+        await asyncio.sleep(0.25)
+    raise RuntimeError(f"Browser daemon did not come up on port {port}")
+
+
+async def serve(port: int, headless: bool, idle_timeout: int):
+    """
+    Run Chromium with remote debugging enabled until it has been idle too long.
+
+    Args:
+        port: Remote debugging port
+        headless: Whether to run headless
+        idle_timeout: Seconds without open pages before shutting down
+    """
+    endpoint = cdp_endpoint_for(port)
+    if await asyncio.to_thread(probe_endpoint, endpoint):
+        logger.info(f"A browser is already listening at {endpoint}")
+        return
+
+    async with async_playwright() as p:
+        executable = p.chromium.executable_path
+
+    user_data_dir = tempfile.mkdtemp(prefix="agoda-cdp-")
+    args = [executable, f"--remote-debugging-port={port}", f"--user-data-dir={user_data_dir}", *LAUNCH_ARGS]
+    if headless:
+        args.append("--headless=new")
+    process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    try:
+        ws_endpoint = None
+        for _ in range(120):
+            ws_endpoint = await asyncio.to_thread(probe_endpoint, endpoint)
+            if ws_endpoint or process.poll() is not None:
+                break
+            await asyncio.sleep(0.25)
+        if not ws_endpoint:
+            logger.error("Browser failed to start")
+            return
+
+        print(ws_endpoint, flush=True)
+        logger.info(f"Browser daemon listening at {endpoint} (idle timeout {idle_timeout}s)")
+
+        idle_since = time.monotonic()
+        while process.poll() is None:
+            await asyncio.sleep(5)
+            if await asyncio.to_thread(count_open_pages, endpoint):
+                idle_since = time.monotonic()
+            elif time.monotonic() - idle_since > idle_timeout:
+                logger.info("Browser daemon idle, shutting down")
+                break
+    finally:
+        if process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except Exception:
+                process.kill()
+        shutil.rmtree(user_data_dir, ignore_errors=True)
+
+
+def main():
+    """Command line entry point for the browser daemon."""
+    parser = argparse.ArgumentParser(description="Shared Chromium for scraper runs (CDP)")
+    parser.add_argument("--port", type=int, default=DEFAULT_CDP_PORT, help="Remote debugging port")
+    parser.add_argument(
+        "--idle-timeout",
+        type=int,
+        default=DEFAULT_IDLE_TIMEOUT,
+        help="Seconds without open pages before the daemon exits",
+    )
+    parser.add_argument("--no-headless", action="store_true", help="Run the browser visibly")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    asyncio.run(serve(args.port, not args.no_headless, args.idle_timeout))
+
+
+if __name__ == "__main__":
+    main()
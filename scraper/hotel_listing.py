@@ -167,8 +167,12 @@ async def navigate_to_search(
                     return True
         
         # If no specific selector found, check if we have any content
-        content = await page.content()
-        if "hotel" in content.lower() or "property" in content.lower():
+        # (searched in the browser so the whole DOM isn't shipped back just for a substring test)
+        has_listing_text = await page.evaluate('''() => {
+            const html = document.documentElement.outerHTML.toLowerCase();
+            return html.includes("hotel") || html.includes("property");
+        }''')
+        if has_listing_text:
             logger.warning("Hotel cards found but with unknown structure")
             return True
             
@@ -276,12 +280,16 @@ async def scrape_hotel_listings(
         hotel_count = 0
         used_selector = None
         
-        for selector in count_selectors:
-            elements = await page.query_selector_all(selector)
-            if len(elements) > 0:
-                used_selector = selector
-                hotel_count = len(elements)
-                break
+        # First selector with any matches, found in one round-trip without element handles
+        first_match = await page.evaluate('''(selectors) => {
+            for (const selector of selectors) {
+                const count = document.querySelectorAll(selector).length;
+                if (count > 0) return [selector, count];
+            }
+            return null;
+        }''', count_selectors)
+        if first_match:
+            used_selector, hotel_count = first_match
         
         if used_selector:
             logger.info(f"Using selector '{used_selector}' for counting hotels")
@@ -736,8 +744,8 @@ def build_hotel_url_with_dates(
     params = parse_qs(parsed.query)
     
     # Update date parameters
-    params['checkIn'] = [check_in.strftime('%Y-%m-%d')]
-    params['checkOut'] = [check_out.strftime('%Y-%m-%d')]
+    params['checkIn'] = [check_in.date().isoformat()]
+    params['checkOut'] = [check_out.date().isoformat()]
     params['adults'] = [str(guests)]
     params['rooms'] = [str(rooms)]
     params['children'] = ['0']
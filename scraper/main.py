@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Optional
 
 from .browser import BrowserManager, random_delay
+from .browser_pool import ensure_browser_daemon
 from .hotel_listing import scrape_hotel_listings
 from .room_details import scrape_hotel_rooms_for_dates
 from .models import ScraperConfig, HotelWithRooms, ScrapeResult
@@ -51,8 +52,15 @@ async def run_scraper(config: ScraperConfig, headless: bool = True) -> ScrapeRes
     output = OutputManager(config)
     logger.info(f"Output files will be saved to: {output.output_dir}")
     
-    # Start browser
-    browser_manager = BrowserManager(headless=headless)
+    # Start browser (or attach to a shared one)
+    cdp_endpoint = config.cdp_endpoint
+    if cdp_endpoint == "auto":
+        cdp_endpoint = await ensure_browser_daemon(headless=headless)
+    browser_manager = BrowserManager(
+        headless=headless,
+        block_resources=config.block_resources,
+        cdp_endpoint=cdp_endpoint,
+    )
     
     try:
         page = await browser_manager.start()
@@ -227,6 +235,33 @@ def parse_args():
         help="Run browser in visible mode (for debugging)",
     )
     
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="Number of dates to scrape in parallel per hotel (overrides config)",
+        default=None,
+    )
+    
+    parser.add_argument(
+        "--debug-html",
+        action="store_true",
+        help="Save intercepted API samples and debug HTML under the output directory",
+    )
+    
+    parser.add_argument(
+        "--block-resources",
+        action="store_true",
+        help="Abort image, font, stylesheet and analytics requests (faster, but pages look less like a real browser)",
+    )
+    
+    parser.add_argument(
+        "--cdp-endpoint",
+        type=str,
+        help="Attach to a running browser over CDP instead of launching one "
+             "('auto' starts/reuses the local scraper.browser_pool daemon)",
+        default=None,
+    )
+    
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -256,6 +291,14 @@ def main():
         config.days_ahead = args.days
     if args.output:
         config.output_dir = args.output
+    if args.concurrency:
+        config.concurrency = args.concurrency
+    if args.debug_html:
+        config.debug_html = True
+    if args.block_resources:
+        config.block_resources = True
+    if args.cdp_endpoint:
+        config.cdp_endpoint = args.cdp_endpoint
     
     headless = not args.no_headless
     
@@ -6,7 +6,26 @@ from typing import Optional
 from pydantic import BaseModel, Field
 
 
-@dataclass
+# Room CSV columns, in the order RoomData.to_csv_values() returns them
+CSV_COLUMNS = (
+    "hotel_name",
+    "hotel_location",
+    "hotel_rating",
+    "hotel_star_rating",
+    "hotel_review_count",
+    "date",
+    "room_type",
+    "price",
+    "currency",
+    "amenities",
+    "availability",
+    "availability_count",
+    "cancellation_policy",
+    "meal_plan",
+)
+
+
+@dataclass(slots=True)
 class HotelInfo:
     """Basic hotel information from search results."""
     name: str
@@ -32,7 +51,7 @@ class HotelInfo:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class RoomData:
     """Room information for a specific date."""
     hotel_name: str
@@ -74,29 +93,29 @@ class RoomData:
             "hotel_review_count": self.hotel_review_count,
         }
 
-    def to_csv_row(self) -> dict:
-        """Convert to CSV row format."""
+    def to_csv_values(self) -> tuple:
+        """Convert to a CSV row tuple in CSV_COLUMNS order (no per-row dict)."""
         # if self.availability_count is not None:
         #     availability_display = str(self.availability_count)
         # else:
         #     availability_display = "Available" if self.is_available else "Not Available"
         
-        return {
-            "hotel_name": self.hotel_name,
-            "hotel_location": self.hotel_location or "",
-            "hotel_rating": self.hotel_rating if self.hotel_rating else "",
-            "hotel_star_rating": self.hotel_star_rating if self.hotel_star_rating else "",
-            "hotel_review_count": self.hotel_review_count if self.hotel_review_count else "",
-            "date": self.date,
-            "room_type": self.room_type,
-            "price": self.price if self.price else "",
-            "currency": self.currency,
-            "amenities": ";".join(self.amenities) if self.amenities else "",
-            "availability": "Available" if self.is_available else "Not Available",
-            "availability_count": self.availability_count if self.availability_count is not None else "",
-            "cancellation_policy": self.cancellation_policy or "",
-            "meal_plan": self.meal_plan or "",
-        }
+        return (
+            self.hotel_name,
+            self.hotel_location or "",
+            self.hotel_rating if self.hotel_rating else "",
+            self.hotel_star_rating if self.hotel_star_rating else "",
+            self.hotel_review_count if self.hotel_review_count else "",
+            self.date,
+            self.room_type,
+            self.price if self.price else "",
+            self.currency,
+            ";".join(self.amenities) if self.amenities else "",
+            "Available" if self.is_available else "Not Available",
+            self.availability_count if self.availability_count is not None else "",
+            self.cancellation_policy or "",
+            self.meal_plan or "",
+        )
 
 
 @dataclass
@@ -136,13 +155,17 @@ class ScraperConfig(BaseModel):
     output_dir: str = "output"
     headless: bool = True
     save_interval: int = 5  # Save progress every N hotels
+    debug_html: bool = False  # Dump API samples / rendered HTML for debugging
+    concurrency: int = 1  # Pages scraping dates of a hotel at the same time
+    block_resources: bool = False  # Abort images/fonts/CSS/analytics requests (opt-in)
+    cdp_endpoint: Optional[str] = None  # Attach to a shared browser ("auto" = local browser_pool daemon)
 
     @classmethod
     def from_json_file(cls, filepath: str) -> "ScraperConfig":
         """Load configuration from JSON file."""
-        import json
-        with open(filepath, "r") as f:
-            data = json.load(f)
+        import orjson
+        with open(filepath, "rb") as f:
+            data = orjson.loads(f.read())
         
         # Convert delay lists to tuples
         if "delays" in data:
@@ -26,14 +26,14 @@ import random
 import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List, Callable
+from typing import Optional, List, Dict, Callable
 from dataclasses import dataclass, field
 
 from playwright.async_api import async_playwright, Browser, Page, BrowserContext
 
-from .models import ScraperConfig, HotelInfo, RoomData
+from .models import ScraperConfig, HotelInfo, RoomData, CSV_COLUMNS
 from .room_details import scrape_hotel_rooms
-from .browser import random_delay
+from .browser import random_delay, run_on_page_pool, block_heavy_resources, LAUNCH_ARGS, NO_IMAGES_ARG
 
 logger = logging.getLogger(__name__)
 
@@ -266,17 +266,15 @@ class ThreadSafeCSVWriter:
         """Initialize CSV with headers."""
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
         with open(self.filepath, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=self.headers)
-            writer.writeheader()
+            csv.writer(f).writerow(self.headers)
     
-    def append_rows(self, rows: List[dict]):
-        """Append rows to CSV in a thread-safe manner."""
+    def append_rows(self, rows: List[tuple]):
+        """Append rows (value tuples in header order) to CSV in a thread-safe manner."""
         if not rows:
             return
         with self.lock:
             with open(self.filepath, "a", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=self.headers)
-                writer.writerows(rows)
+                csv.writer(f).writerows(rows)
             self.rows_written += len(rows)
 
 
@@ -284,6 +282,7 @@ async def create_browser_with_fingerprint(
     playwright,
     worker: BrowserWorker,
     headless: bool = True,
+    block_resources: bool = False,
 ) -> tuple[Browser, Page]:
     """
     Launch a NEW browser instance with unique fingerprint.
@@ -296,17 +295,14 @@ async def create_browser_with_fingerprint(
     - Optional dedicated proxy
     
     This makes each browser appear as a different user to Agoda.
+    With block_resources, images/fonts/CSS/analytics requests are aborted.
     """
     launch_args = [
-        "--disable-blink-features=AutomationControlled",
-        "--disable-dev-shm-usage",
-        "--no-sandbox",
-        "--disable-setuid-sandbox",
-        "--disable-infobars",
-        "--window-position=0,0",
-        "--ignore-certificate-errors",
+        *LAUNCH_ARGS,
         f"--window-size={worker.viewport['width']},{worker.viewport['height']}",
     ]
+    if block_resources:
+        launch_args.append(NO_IMAGES_ARG)
     
     # Launch with or without proxy
     launch_kwargs = {
@@ -374,6 +370,9 @@ async def create_browser_with_fingerprint(
         );
     """)
     
+    if block_resources:
+        await block_heavy_resources(context)
+    
     page = await context.new_page()
     
     # Longer timeouts for proxied connections
@@ -481,7 +480,7 @@ async def scrape_with_retry(
     logger.error(f"All retries failed for {hotel.name} on {check_in.date()}: {last_error}")
     return [RoomData(
         hotel_name=hotel.name,
-        date=check_in.strftime("%Y-%m-%d"),
+        date=check_in.date().isoformat(),
         room_type="Error",
         price=None,
         currency=hotel.currency or "INR",
@@ -495,6 +494,57 @@ async def scrape_with_retry(
     )]
 
 
+async def scrape_dates_on_pages(
+    context: BrowserContext,
+    hotel: HotelInfo,
+    check_ins: List[datetime],
+    config: ScraperConfig,
+    session_id: str,
+    max_retries: int = 3,
+    concurrency: int = 2,
+    delay_range: Optional[tuple] = None,
+    on_rooms: Optional[Callable[[datetime, List[RoomData]], bool]] = None,
+    on_error: Optional[Callable[[datetime, Exception], bool]] = None,
+) -> Dict[datetime, List[RoomData]]:
+    """
+    Scrape many dates of one hotel with at most `concurrency` in flight.
+    
+    A sliding window: as soon as one date finishes the next one starts on the
+    freed page, instead of waiting for a whole batch. Pages live in the
+    worker's own context (same fingerprint and cookies), are reused across
+    dates and closed at the end.
+    
+    Args:
+        on_rooms: Called with (check_in, rooms) as each date finishes
+        on_error: Called with (check_in, exception) when a date raises
+        Either callback returning True stops the window: dates still running
+        or waiting are cancelled.
+    
+    Returns:
+        Rooms per finished check-in date ([] for dates that raised); dates
+        cancelled by a stop are missing
+    """
+    finished: Dict[datetime, List[RoomData]] = {}
+    
+    def on_done(index: int, rooms: Optional[List[RoomData]], error: Optional[Exception]) -> bool:
+        check_in = check_ins[index]
+        if error is not None:
+            finished[check_in] = []
+            return bool(on_error and on_error(check_in, error))
+        finished[check_in] = rooms
+        return bool(on_rooms and on_rooms(check_in, rooms))
+    
+    await run_on_page_pool(
+        context,
+        check_ins,
+        lambda date_page, check_in: scrape_with_retry(date_page, hotel, check_in, config, session_id, max_retries),
+        on_done,
+        concurrency,
+        delay_range,
+    )
+    return finished
+
+
 async def browser_worker_task(
     playwright,
     worker: BrowserWorker,
@@ -525,7 +575,9 @@ async def browser_worker_task(
     
     try:
         # Launch dedicated browser for this worker
-        browser, page = await create_browser_with_fingerprint(playwright, worker, headless)
+        browser, page = await create_browser_with_fingerprint(
+            playwright, worker, headless, block_resources=config.block_resources
+        )
         
         while True:
             try:
@@ -549,52 +601,78 @@ async def browser_worker_task(
                 hotel_rooms = []
                 consecutive_errors = 0
                 
-                # Scrape each date for this hotel
-                for day_offset in range(config.days_ahead):
-                    check_in = start_date + timedelta(days=day_offset)
+                # Scrape the dates for this hotel, config.concurrency at a time
+                check_ins = [start_date + timedelta(days=day_offset) for day_offset in range(config.days_ahead)]
+                concurrency = max(1, config.concurrency)
+                
+                def handle_rooms(check_in: datetime, rooms: List[RoomData]) -> bool:
+                    """Record one date's rooms as soon as they arrive; True if the browser looks broken."""
+                    nonlocal consecutive_errors
+                    hotel_rooms.extend(rooms)
                     
-                    try:
-                        # Use retry wrapper
-                        rooms = await scrape_with_retry(
-                            page, hotel, check_in, config, session_id, max_retries
-                        )
-                        hotel_rooms.extend(rooms)
-                        
-                        # Track progress as soon as we get usable room data (avoid waiting for hotel completion)
-                        successful_rooms = [r for r in rooms if r.room_type != "Error"]
-                        if successful_rooms:
-                            worker.rooms_scraped += len(successful_rooms)
-                        
-                        # Check if we got real data or error placeholder
-                        if rooms and rooms[0].room_type != "Error":
-                            consecutive_errors = 0
-                        else:
-                            consecutive_errors += 1
-                        
-                        # Write to CSV immediately (thread-safe)
-                        if rooms:
-                            csv_writer.append_rows([r.to_csv_row() for r in rooms])
-                        
-                        # If too many consecutive errors, browser might be broken
-                        if consecutive_errors >= 5:
-                            logger.warning(f"[Browser {worker.worker_id}] Too many errors, restarting browser...")
-                            # Close and restart browser
-                            if page:
-                                await page.close()
-                            if browser:
-                                await browser.close()
-                            browser, page = await create_browser_with_fingerprint(playwright, worker, headless)
-                            consecutive_errors = 0
-                            await asyncio.sleep(3)  # Wait after restart
-                        
-                        # Delay between dates
-                        if day_offset < config.days_ahead - 1:
-                            await random_delay(*delay_between_dates)
-                            
-                    except Exception as e:
-                        logger.warning(f"[Browser {worker.worker_id}] Error on {hotel.name} date {check_in.date()}: {e}")
-                        worker.errors += 1
+                    # Track progress as soon as we get usable room data (avoid waiting for hotel completion)
+                    successful_rooms = [r for r in rooms if r.room_type != "Error"]
+                    if successful_rooms:
+                        worker.rooms_scraped += len(successful_rooms)
+                    
+                    # Check if we got real data or error placeholder
+                    if rooms and rooms[0].room_type != "Error":
+                        consecutive_errors = 0
+                    else:
                         consecutive_errors += 1
+                    
+                    # Write to CSV immediately (thread-safe)
+                    if rooms:
+                        csv_writer.append_rows([r.to_csv_values() for r in rooms])
+                    return consecutive_errors >= 5
+                
+                def handle_error(check_in: datetime, error: Exception) -> bool:
+                    """Count a date that raised; True if the browser looks broken."""
+                    nonlocal consecutive_errors
+                    logger.warning(f"[Browser {worker.worker_id}] Error on {hotel.name} date {check_in.date()}: {error}")
+                    worker.errors += 1
+                    consecutive_errors += 1
+                    return consecutive_errors >= 5
+                
+                pending_dates = check_ins
+                while pending_dates:
+                    if concurrency == 1:
+                        check_in, pending_dates = pending_dates[0], pending_dates[1:]
+                        try:
+                            # Use retry wrapper
+                            handle_rooms(check_in, await scrape_with_retry(
+                                page, hotel, check_in, config, session_id, max_retries
+                            ))
+                        except Exception as e:
+                            handle_error(check_in, e)
+                    else:
+                        # Sliding window; stops early (cancelling the rest) once errors pile up
+                        finished = await scrape_dates_on_pages(
+                            page.context, hotel, pending_dates, config, session_id, max_retries,
+                            concurrency=concurrency,
+                            delay_range=delay_between_dates,
+                            on_rooms=handle_rooms,
+                            on_error=handle_error,
+                        )
+                        pending_dates = [d for d in pending_dates if d not in finished]
+                    
+                    # If too many consecutive errors, browser might be broken
+                    if consecutive_errors >= 5:
+                        logger.warning(f"[Browser {worker.worker_id}] Too many errors, restarting browser...")
+                        # Close and restart browser
+                        if page:
+                            await page.close()
+                        if browser:
+                            await browser.close()
+                        browser, page = await create_browser_with_fingerprint(
+                            playwright, worker, headless, block_resources=config.block_resources
+                        )
+                        consecutive_errors = 0
+                        await asyncio.sleep(3)  # Wait after restart
+                    
+                    # Delay between dates
+                    if pending_dates:
+                        await random_delay(*delay_between_dates)
                 
                 # Update stats
                 worker.hotels_processed += 1
@@ -687,13 +765,8 @@ async def multi_browser_scrape(
     if output_file is None:
         output_file = f"output/csv/multi_browser_{session_id}.csv"
     
-    # CSV headers
-    csv_headers = [
-        "hotel_name", "hotel_location", "hotel_rating", "hotel_star_rating",
-        "hotel_review_count", "date", "room_type", "price", "currency",
-        "amenities", "availability","availability_count", "cancellation_policy", "meal_plan",
-    ]
-    csv_writer = ThreadSafeCSVWriter(output_file, csv_headers)
+    # CSV headers (rows are RoomData.to_csv_values() tuples in this order)
+    csv_writer = ThreadSafeCSVWriter(output_file, list(CSV_COLUMNS))
     
     # Results storage
     results: List[RoomData] = []
@@ -1,14 +1,16 @@
 """Output handlers for CSV and JSON export."""
 
 import csv
-import json
 import logging
 import os
+from operator import itemgetter
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from .models import RoomData, HotelWithRooms, ScrapeResult, ScraperConfig
+import orjson
+
+from .models import RoomData, HotelWithRooms, ScrapeResult, ScraperConfig, CSV_COLUMNS
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +49,8 @@ class OutputManager:
             "cancellation_policy",
             "meal_plan",
         ]
+        # Picks these columns out of RoomData.to_csv_values() tuples
+        self._csv_values = itemgetter(*(CSV_COLUMNS.index(h) for h in self.csv_headers))
         
         # Initialize CSV file with headers
         self._init_csv()
@@ -64,8 +68,7 @@ class OutputManager:
     def _init_csv(self):
         """Initialize CSV file with headers."""
         with open(self.csv_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=self.csv_headers)
-            writer.writeheader()
+            csv.writer(f).writerow(self.csv_headers)
         logger.info(f"Initialized CSV file: {self.csv_path}")
 
     def append_rooms_to_csv(self, rooms: list[RoomData]):
@@ -78,10 +81,9 @@ class OutputManager:
         if not rooms:
             return
             
+        pick = self._csv_values
         with open(self.csv_path, "a", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=self.csv_headers)
-            for room in rooms:
-                writer.writerow(room.to_csv_row())
+            csv.writer(f).writerows([pick(room.to_csv_values()) for room in rooms])
         
         self.total_rooms += len(rooms)
         logger.debug(f"Appended {len(rooms)} rooms to CSV")
@@ -101,8 +103,8 @@ class OutputManager:
             "config": result.config.to_dict(),
         }
         
-        with open(self.progress_path, "w", encoding="utf-8") as f:
-            json.dump(progress_data, f, indent=2)
+        with open(self.progress_path, "wb") as f:
+            f.write(orjson.dumps(progress_data, option=orjson.OPT_INDENT_2))
         
         logger.debug(f"Progress saved: {len(result.hotels)} hotels, {progress_data['total_rooms']} rooms")
 
@@ -113,8 +115,8 @@ class OutputManager:
         Args:
             result: Complete ScrapeResult object
         """
-        with open(self.json_path, "w", encoding="utf-8") as f:
-            json.dump(result.to_dict(), f, indent=2, ensure_ascii=False)
+        with open(self.json_path, "wb") as f:
+            f.write(orjson.dumps(result.to_dict(), option=orjson.OPT_INDENT_2))
         
         logger.info(f"Saved final JSON: {self.json_path}")
 
@@ -150,11 +152,11 @@ def export_to_csv(rooms: list[RoomData], filepath: str):
         "meal_plan",
     ]
     
+    pick = itemgetter(*(CSV_COLUMNS.index(h) for h in headers))
     with open(filepath, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        for room in rooms:
-            writer.writerow(room.to_csv_row())
+        writer = csv.writer(f)
+        writer.writerow(headers)
+        writer.writerows([pick(room.to_csv_values()) for room in rooms])
     
     logger.info(f"Exported {len(rooms)} rooms to CSV: {filepath}")
 
@@ -170,8 +172,8 @@ def export_to_json(result: ScrapeResult, filepath: str):
     # Ensure directory exists
     Path(filepath).parent.mkdir(parents=True, exist_ok=True)
     
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(result.to_dict(), f, indent=2, ensure_ascii=False)
+    with open(filepath, "wb") as f:
+        f.write(orjson.dumps(result.to_dict(), option=orjson.OPT_INDENT_2))
     
     logger.info(f"Exported result to JSON: {filepath}")
 
@@ -242,8 +244,8 @@ def load_progress(progress_path: str) -> Optional[dict]:
         Progress data dictionary or None if not found
     """
     try:
-        with open(progress_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(progress_path, "rb") as f:
+            return orjson.loads(f.read())
     except FileNotFoundError:
         return None
     except Exception as e:
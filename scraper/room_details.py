@@ -1,18 +1,20 @@
 """Room details scraper for individual Agoda hotel pages."""
 
 import re
+import math
 import logging
 import asyncio
 import os
-import json
-import random
 from datetime import datetime, timedelta
-from typing import Optional, Callable
-from playwright.async_api import Page
-from bs4 import BeautifulSoup
+from functools import lru_cache
+from typing import Optional, Callable, Iterable
+import orjson
+from playwright.async_api import APIRequestContext, BrowserContext, Page
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
 
 from .models import HotelInfo, RoomData, ScraperConfig
-from .browser import random_delay, wait_for_element, safe_click, scroll_to_bottom
+from .browser import random_delay, run_on_page_pool, wait_for_element, safe_click, scroll_to_bottom
 from .hotel_listing import build_hotel_url_with_dates
 
 logger = logging.getLogger(__name__)
@@ -62,6 +64,310 @@ PROMO_STARTERS = [
     'price includes', '% discount', '% off'
 ]
 
+# Tuple forms for str.startswith, which scans a tuple of prefixes in C
+_ROOM_TYPE_PREFIXES = tuple(ROOM_TYPE_KEYWORDS)
+_PROMO_PREFIXES = tuple(PROMO_STARTERS)
+_QUESTION_PREFIXES = ('does ', 'what ', 'how ', 'is ', 'can ', 'do ', 'are ', 'will ', 'where ')
+_GARBAGE_INDICATORS = ('express', 'wifi', 'sponsored', 'agoda', 'booking', 'check-in')
+_KING_ROOM_WORDS = ('room', 'suite', 'bed', 'deluxe', 'standard')
+
+# Substring checks as one alternation each, so a name is scanned once per list
+# rather than once per word
+_RE_HAS_PROMO = re.compile('|'.join(map(re.escape, PROMO_STARTERS)))
+_RE_HAS_ROOM_TYPE = re.compile('|'.join(map(re.escape, ROOM_TYPE_KEYWORDS)))
+_RE_BLACKLISTED = re.compile('|'.join(map(re.escape, ROOM_NAME_BLACKLIST)))
+_RE_KING_ROOM_WORDS = re.compile('|'.join(map(re.escape, _KING_ROOM_WORDS)))
+# Lookahead so every indicator is seen even where two overlap
+_RE_GARBAGE = re.compile('(?=(' + '|'.join(map(re.escape, _GARBAGE_INDICATORS)) + '))')
+
+# Patterns compiled once at import; the HTML extractors run them for every room element
+_RE_DIGITS = re.compile(r'(\d+)')
+_RE_HTML_TAG = re.compile(r'<[^>]+>')
+_RE_WHITESPACE = re.compile(r'\s+')
+# Room container attributes
+_RE_MASTERROOM = re.compile(r'MasterRoom', re.I)
+_RE_ROOM_ANY = re.compile(r'room', re.I)
+_RE_ROOM_GRID_CLASS = re.compile(r'room.*grid|room.*item|RoomGrid', re.I)
+_RE_CHILD_ROOMS_CLASS = re.compile(r'ChildRoomsList|RoomGridItem', re.I)
+_RE_ROOM_CARD_CLASS = re.compile(r'room-card|roomCard', re.I)
+# Room name attributes and text
+_RE_ROOM_NAME = re.compile(r'room.*name', re.I)
+_RE_ROOM_TITLE_NAME = re.compile(r'room.*title|room.*name', re.I)
+_RE_ROOM_TYPE = re.compile(
+    r'\b((?:Deluxe|Standard|Superior|Premium|Classic|Executive|Family|Luxury|Triple|Quad)[\s\-]*(?:Room|Suite)(?:\s+(?:King|Queen|Twin|Double))?)',
+    re.I,
+)
+# "Deluxe Room ... ₹3,500" or "Deluxe Room ... R . 3,500"
+_RE_ROOM_PRICE_LINE = re.compile(
+    r'(?P<name>(?:Deluxe|Standard|Superior|Premium|Executive|Family|Luxury|Suite|Studio|Twin|Double|Single|Queen|King)[\s\w\-]*(?:Room|Suite|Bed)?)\s*(?:.*?)(?:₹|R\s*\.)\s*(?P<amt>[\d,]+)',
+    re.I,
+)
+# Price attributes and text
+_RE_PRICE_CLASS = re.compile(r'price.*amount|final.*price', re.I)
+_RE_PROPERTY_CARD_PRICE = re.compile(r'PropertyCardPrice', re.I)
+_RE_SOLD_OUT = re.compile(r'sold.*out', re.I)
+# Sold-out markers and the room's price area, found with a single select_one
+_SOLD_OUT_OR_PRICE_AREA = '[data-selenium*="sold" i], [data-ppapi="room-price"], [class*="price" i]'
+# Price amounts observed: "R . 3,939", "R.3939", "₹3,939", "Rs. 3939" or "INR 3939"
+_RE_PRICE_AMOUNT = re.compile(r'(?:R\s*\.?\s*|₹\s*|Rs\.?\s*|INR\s*)(?P<amt>[\d,]+)')
+_RE_PRICE_PREFIX = re.compile(r'R\s*\.?\s*')
+# Currency symbols, thousands separators and every character re's \s matches
+# (all Unicode whitespace sits at or below U+3000), dropped in one C-level pass
+_PRICE_STRIP_TABLE = str.maketrans(
+    '', '', '₹$€£,' + ''.join(ch for ch in map(chr, range(0x3001)) if ch.isspace())
+)
+_CURRENCY_MARKERS = {
+    '₹': 'INR', 'INR': 'INR',
+    '$': 'USD', 'USD': 'USD',
+    '€': 'EUR', 'EUR': 'EUR',
+    '£': 'GBP', 'GBP': 'GBP',
+}
+_RE_CURRENCY = re.compile(r'[₹$€£]|INR|USD|EUR|GBP')
+_RE_PRICE_NUMBER = re.compile(r'\d[\d,]*\.?\d*')
+# Detail extractor attributes
+_RE_AMENITY_CLASS = re.compile(r'amenity|feature|benefit', re.I)
+_RE_AMENITY_ITEM_CLASS = re.compile(r'amenity|feature', re.I)
+_RE_AMENITY_NAME = re.compile(r'amenity|benefit', re.I)
+_RE_CANCELLATION = re.compile(r'cancellation', re.I)
+_RE_CANCEL_REFUND = re.compile(r'cancellation|refund', re.I)
+_RE_MEAL = re.compile(r'meal|breakfast|board', re.I)
+_RE_BED = re.compile(r'bed', re.I)
+_RE_BED_CLASS = re.compile(r'bed.*type|bed.*info', re.I)
+_RE_OCCUPANCY = re.compile(r'occupancy|guest', re.I)
+_RE_OCCUPANCY_CLASS = re.compile(r'occupancy|capacity', re.I)
+
+# Selector tables, built once at import; the helpers below only iterate them.
+# BeautifulSoup lookups are (tag, attrs) pairs tried in order.
+_ROOM_SELECTORS = (
+    ('div', {'data-selenium': 'room-panel'}),
+    ('div', {'data-element-name': 'room-item'}),
+    ('div', {'data-selenium': 'room-item'}),
+    ('div', {'class': _RE_MASTERROOM}),
+    ('tr', {'data-selenium': _RE_ROOM_ANY}),
+    ('div', {'class': _RE_ROOM_GRID_CLASS}),
+    # Additional selectors based on Agoda's actual structure
+    ('div', {'data-ppapi': _RE_ROOM_ANY}),
+    ('section', {'data-element-name': _RE_ROOM_ANY}),
+    # From accessibility tree: room containers have specific patterns
+    ('div', {'class': _RE_CHILD_ROOMS_CLASS}),
+    ('div', {'class': _RE_ROOM_CARD_CLASS}),
+    ('div', {'data-testid': _RE_ROOM_ANY}),
+)
+
+
+def _is_room_subtree(name, attrs) -> bool:
+    """SoupStrainer filter: keep tags whose class or data-* attributes mention 'room'."""
+    for key in ('class', 'data-selenium', 'data-element-name', 'data-ppapi', 'data-testid'):
+        value = attrs.get(key)
+        if not value:
+            continue
+        # Attribute values are still raw strings while parsing, but be lenient
+        if isinstance(value, list):
+            value = ' '.join(value)
+        if 'room' in value.lower():
+            return True
+    return False
+
+
+# Every _ROOM_SELECTORS match mentions 'room' in one of these attributes, so a strained
+# parse finds the same containers without building the rest of the page
+_ROOM_STRAINER = SoupStrainer(_is_room_subtree)
+
+_NAME_SELECTORS = (
+    ('span', {'data-selenium': 'masterroom-title-name'}),
+    ('span', {'data-selenium': 'room-name'}),
+    ('h3', {'data-selenium': 'room-name'}),
+    ('span', {'data-element-name': 'room-type-name'}),
+    ('a', {'class': _RE_ROOM_NAME}),
+    ('span', {'class': _RE_ROOM_TITLE_NAME}),
+    ('div', {'data-selenium': _RE_ROOM_NAME}),
+)
+_PRICE_SELECTORS = (
+    ('strong', {'data-ppapi': 'room-price'}),  # Main price selector
+    ('span', {'data-ppapi': 'room-price'}),
+    ('span', {'data-selenium': 'display-price'}),
+    ('span', {'class': _RE_PRICE_CLASS}),
+    ('div', {'data-element-name': 'final-price'}),
+    ('span', {'class': _RE_PROPERTY_CARD_PRICE}),
+)
+_AMENITY_SELECTORS = (
+    ('span', {'class': _RE_AMENITY_CLASS}),
+    ('li', {'class': _RE_AMENITY_ITEM_CLASS}),
+    ('div', {'data-element-name': _RE_AMENITY_NAME}),
+)
+_CANCEL_SELECTORS = (
+    ('span', {'data-selenium': _RE_CANCELLATION}),
+    ('div', {'class': _RE_CANCEL_REFUND}),
+    ('span', {'class': _RE_CANCEL_REFUND}),
+)
+_MEAL_SELECTORS = (
+    ('span', {'data-element-name': _RE_MEAL}),
+    ('div', {'class': _RE_MEAL}),
+)
+_BED_SELECTORS = (
+    ('span', {'data-selenium': _RE_BED}),
+    ('div', {'class': _RE_BED_CLASS}),
+)
+_OCC_SELECTORS = (
+    ('span', {'data-selenium': _RE_OCCUPANCY}),
+    ('div', {'class': _RE_OCCUPANCY_CLASS}),
+)
+
+
+@lru_cache(maxsize=256)
+def _css(selector: str):
+    """Compile a CSS selector with soupsieve once and reuse it for every later lookup."""
+    return sv.compile(selector)
+
+
+def _compile_rules(selectors) -> tuple:
+    """
+    Turn (tag, attrs) lookups into soupsieve rules plus one union selector covering them all.
+    
+    Literal attribute values become exact CSS attribute matches. Regex values can't be
+    written in CSS, so those rules match on attribute presence and keep the regex as a
+    post-filter on the space-joined value, the same way BeautifulSoup applies it.
+    
+    Args:
+        selectors: Sequence of (tag, {attr: value}) pairs, highest priority first
+    
+    Returns:
+        (union, rules) where each rule is (compiled selector, attr name, regex or None)
+    """
+    rules = []
+    for tag, attrs in selectors:
+        (key, value), = attrs.items()
+        if isinstance(value, str):
+            rules.append((f'{tag}[{key}="{value}"]', key, None))
+        else:
+            rules.append((f'{tag}[{key}]', key, value))
+    union = _css(', '.join(css for css, _, _ in rules))
+    return union, tuple((_css(css), key, pattern) for css, key, pattern in rules)
+
+
+def _matches_by_rule(node, union, rules):
+    """
+    Yield matches for each rule in priority order from a single traversal of node.
+    
+    Yields:
+        (rule index, matching elements in document order) for each rule that has matches
+    """
+    candidates = union.select(node)
+    if not candidates:
+        return
+    for index, (compiled, key, pattern) in enumerate(rules):
+        hits = []
+        for el in candidates:
+            if not compiled.match(el):
+                continue
+            if pattern is not None:
+                value = el.get(key)
+                if isinstance(value, list):
+                    value = ' '.join(value)
+                if not pattern.search(value or ''):
+                    continue
+            hits.append(el)
+        if hits:
+            yield index, hits
+
+
+_ROOM_RULES = _compile_rules(_ROOM_SELECTORS)
+_NAME_RULES = _compile_rules(_NAME_SELECTORS)
+_PRICE_RULES = _compile_rules(_PRICE_SELECTORS)
+_AMENITY_RULES = _compile_rules(_AMENITY_SELECTORS)
+_CANCEL_RULES = _compile_rules(_CANCEL_SELECTORS)
+_MEAL_RULES = _compile_rules(_MEAL_SELECTORS)
+_BED_RULES = _compile_rules(_BED_SELECTORS)
+_OCC_RULES = _compile_rules(_OCC_SELECTORS)
+
+# Common amenity keywords in room text -> display name
+_KEYWORD_AMENITIES = {
+    'wifi': 'WiFi',
+    'wi-fi': 'WiFi',
+    'breakfast': 'Breakfast',
+    'parking': 'Parking',
+    'pool': 'Pool Access',
+    'gym': 'Gym Access',
+    'spa': 'Spa Access',
+    'air condition': 'Air Conditioning',
+    'ac': 'Air Conditioning',
+    'minibar': 'Minibar',
+    'mini bar': 'Minibar',
+    'room service': 'Room Service',
+    'tv': 'TV',
+    'balcony': 'Balcony',
+    'sea view': 'Sea View',
+    'city view': 'City View',
+    'garden view': 'Garden View',
+}
+# Every keyword occurrence in one pass. The lookahead matches at each position without
+# consuming text, so overlapping hits (e.g. 'spa' and 'ac' in 'space') are all found, as
+# with per-keyword substring checks; no keyword is a prefix of another, so the first
+# alternative at a position is the only one that can match there
+_RE_AMENITY_KEYWORDS = re.compile(
+    '(?=(' + '|'.join(re.escape(keyword) for keyword in _KEYWORD_AMENITIES) + '))'
+)
+_FLIGHT_TOKENS = ('flight', 'cross-sell', 'airline', 'airport')
+_BED_TYPES = ('king bed', 'queen bed', 'double bed', 'twin bed', 'single bed', 'sofa bed')
+
+# Playwright selectors for the live page
+_POPUP_SELECTORS = (
+    '[data-selenium="close-button"]',
+    '.ab-close-button',
+    '[aria-label="Close"]',
+    'button[class*="close"]',
+    '.Modal__Close',
+    '#onetrust-accept-btn-handler',
+    '[data-element-name="close-button"]',
+)
+# (css, text) pairs; a text makes it the Playwright selector css:has-text("text")
+_ROOMS_TAB_SELECTORS = (
+    ('a', 'Rooms'),
+    ('button', 'Rooms'),
+    ('[data-element-name*="rooms"]', None),
+    ('[href*="#rooms"]', None),
+    ('a[href*="roomsAndRates"]', None),
+    ('[data-selenium*="room"]', None),
+    # Scroll to rooms section anchor
+    ('#roomsAndRates', None),
+    ('#rooms', None),
+)
+_DIRECT_ROOM_SELECTOR = (
+    '[data-ppapi="room-price"], '
+    '[data-selenium="room-panel"], '
+    '[data-selenium="room-name"], '
+    '[data-testid*="room"], '
+    '[class*="RoomGridItem"]'
+)
+_ROOM_POLL_SELECTORS = (
+    '[data-ppapi="room-price"]',  # Price elements (most reliable)
+    '[data-selenium="room-panel"]',
+    '[data-selenium="room-name"]',
+    '[data-element-name="room-item"]',
+    '.MasterRoom',
+    '.RoomGrid',
+    '#roomsAndRates',
+    '[class*="ChildRoomsList"]',
+    '[class*="RoomGridItem"]',
+    '[data-element-name*="room"]',
+    # Additional selectors
+    '[class*="room-grid"]',
+    '[class*="RoomList"]',
+    '[data-testid*="room"]',
+    '[class*="room-card"]',
+    'div[class*="room"]',
+    # Price-based detection
+    '[class*="Price"]',
+    '[data-element-name="final-price"]',
+)
+_EXPAND_SELECTORS = (
+    '[data-selenium="show-more-rooms"]',
+    'button[class*="ShowMore"]',
+    '[data-element-name="show-more-rooms"]',
+    'button:has-text("Show more")',
+    'a:has-text("Show all rooms")',
+)
+
 
 def is_valid_room_name(name: str) -> bool:
     """Check if the room name is valid (not a UI element or pure promotional text)."""
@@ -75,12 +381,11 @@ def is_valid_room_name(name: str) -> bool:
         return False
     
     # Room names starting with question words are likely FAQ text
-    question_starters = ['does ', 'what ', 'how ', 'is ', 'can ', 'do ', 'are ', 'will ', 'where ']
-    if any(name_lower.startswith(q) for q in question_starters):
+    if name_lower.startswith(_QUESTION_PREFIXES):
         return False
     
     # Check if name starts with a valid room type keyword
-    starts_with_room_type = any(name_lower.startswith(kw) for kw in ROOM_TYPE_KEYWORDS)
+    starts_with_room_type = name_lower.startswith(_ROOM_TYPE_PREFIXES)
     
     # If it starts with a room type keyword, it's valid (even with promo text appended)
     # e.g., "Triple Room (15% off on session of Spa...)" is valid
@@ -93,14 +398,11 @@ def is_valid_room_name(name: str) -> bool:
     # For names that DON'T start with room type keywords, apply stricter validation
     
     # Reject if it starts with promotional text
-    for promo in PROMO_STARTERS:
-        if name_lower.startswith(promo):
-            return False
+    if name_lower.startswith(_PROMO_PREFIXES):
+        return False
     
     # Reject if it's purely promotional (contains promo text and NO room type keyword)
-    has_promo = any(promo in name_lower for promo in PROMO_STARTERS)
-    has_room_type = any(kw in name_lower for kw in ROOM_TYPE_KEYWORDS)
-    if has_promo and not has_room_type:
+    if _RE_HAS_PROMO.search(name_lower) and not _RE_HAS_ROOM_TYPE.search(name_lower):
         return False
     
     # Reject if contains exclamation marks (purely promotional text)
@@ -108,28 +410,103 @@ def is_valid_room_name(name: str) -> bool:
         return False
     
     # Check blacklist
-    for blacklisted in ROOM_NAME_BLACKLIST:
-        if blacklisted in name_lower:
-            return False
+    if _RE_BLACKLISTED.search(name_lower):
+        return False
     
     # Room name should not be too long (likely concatenated text)
     if len(name) > 80:
         return False
     
     # Should not contain multiple keywords concatenated (indicates garbage)
-    garbage_indicators = ['express', 'wifi', 'sponsored', 'agoda', 'booking', 'check-in']
-    garbage_count = sum(1 for kw in garbage_indicators if kw in name_lower)
+    garbage_count = len(set(_RE_GARBAGE.findall(name_lower)))
     if garbage_count >= 2:
         return False
     
     # Should not start with "king" followed by random text (FAQ/description)
-    if name_lower.startswith('king') and not any(rm in name_lower for rm in ['room', 'suite', 'bed', 'deluxe', 'standard']):
+    if name_lower.startswith('king') and not _RE_KING_ROOM_WORDS.search(name_lower):
         if len(name) > 30:
             return False
     
     return True
 
 
+# Scroll to fractions of the page in the browser, pausing between steps.
+# Args: [steps, divisor, pauseMs] -> scrollTo(height * i / divisor) for i in 1..steps
+_STEP_SCROLL_JS = '''async ([steps, divisor, pauseMs]) => {
+    const sleep = ms => new Promise(r => setTimeout(r, ms));
+    for (let i = 1; i <= steps; i++) {
+        window.scrollTo(0, document.body.scrollHeight * i / divisor);
+        await sleep(pauseMs);
+    }
+}'''
+
+# Index of the first (css, text) probe whose first match is visible, like
+# page.locator(css:has-text(text)).first.is_visible() for each probe in turn
+_FIRST_VISIBLE_JS = '''(probes) => {
+    for (let i = 0; i < probes.length; i++) {
+        const [css, text] = probes[i];
+        let el;
+        try {
+            el = Array.from(document.querySelectorAll(css)).find(
+                e => !text || (e.textContent || '').toLowerCase().includes(text.toLowerCase()));
+        } catch (e) {
+            continue;
+        }
+        if (!el) continue;
+        const rect = el.getBoundingClientRect();
+        if (rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden') return i;
+    }
+    return -1;
+}'''
+
+# Polled by wait_for_function: the first selector with matches, or 'price text' once a
+# rendered "₹" amount shows up; falsy (keep polling) otherwise
+_ROOMS_PRESENT_JS = r'''(selectors) => {
+    for (const selector of selectors) {
+        try {
+            if (document.querySelector(selector)) return selector;
+        } catch (e) {}
+    }
+    return /₹\s*[\d,]{3,}/.test(document.body.innerText) ? 'price text' : null;
+}'''
+
+# Where legacy responses keep the masterRooms list, tried in order
+_LEGACY_PATHS = (
+    ('roomGridData', 'masterRooms'),
+    ('datelessMasterRoomInfo',),
+    ('masterRooms',),
+    ('data', 'masterRooms'),
+)
+
+
+def _room_base(hotel: HotelInfo, date_str: str) -> dict:
+    """
+    Hotel and date fields shared by every RoomData of one hotel/date.
+    
+    Build it once per parse and splat it into each RoomData(**base, ...) instead of
+    re-reading the hotel attributes for every room.
+    """
+    return dict(
+        hotel_name=hotel.name,
+        date=date_str,
+        hotel_location=hotel.location,
+        hotel_rating=hotel.rating,
+        hotel_star_rating=hotel.star_rating,
+        hotel_review_count=hotel.review_count,
+    )
+
+
+def _dig(data, *path):
+    """Walk nested dicts by key, returning None as soon as a step is missing or not a dict."""
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+        if data is None:
+            return None
+    return data
+
+
 def parse_room_grid_api(json_data: dict, hotel: HotelInfo, date_str: str) -> list[RoomData]:
     """
     Parse room data from the NEW Agoda room-grid API (v1).
@@ -145,6 +522,9 @@ def parse_room_grid_api(json_data: dict, hotel: HotelInfo, date_str: str) -> lis
         List of RoomData objects
     """
     rooms = []
+    _append = rooms.append  # bound once; called for every offer
+    # Hotel/date fields shared by every RoomData built below
+    base = _room_base(hotel, date_str)
     
     room_list = json_data.get('rooms', [])
     if not room_list:
@@ -175,8 +555,7 @@ def parse_room_grid_api(json_data: dict, hotel: HotelInfo, date_str: str) -> lis
                         bed_type = text
                     elif feature_type == 'MAX_OCCUPANCY':
                         # Extract number from "Max X adults"
-                        import re
-                        match = re.search(r'(\d+)', text)
+                        match = _RE_DIGITS.search(text)
                         if match:
                             max_occupancy = int(match.group(1))
             
@@ -184,16 +563,13 @@ def parse_room_grid_api(json_data: dict, hotel: HotelInfo, date_str: str) -> lis
             offers = room.get('offers', [])
             if not offers:
                 # Room exists but no offers available - use room-level facilities as fallback
-                amenities = []
-                for facility in room.get('facilities', []):
-                    if isinstance(facility, dict) and facility.get('text'):
-                        facility_text = facility.get('text')
-                        if isinstance(facility_text, str):
-                            amenities.append(facility_text)
+                amenities = [
+                    facility['text'] for facility in room.get('facilities', ())
+                    if isinstance(facility, dict) and facility.get('text') and isinstance(facility['text'], str)
+                ]
                 
-                rooms.append(RoomData(
-                    hotel_name=hotel.name,
-                    date=date_str,
+                _append(RoomData(
+                    **base,
                     room_type=room_name,
                     price=None,
                     currency="INR",
@@ -202,66 +578,55 @@ def parse_room_grid_api(json_data: dict, hotel: HotelInfo, date_str: str) -> lis
                     availability_count=None,
                     bed_type=bed_type,
                     max_occupancy=max_occupancy,
-                    hotel_location=hotel.location,
-                    hotel_rating=hotel.rating,
-                    hotel_star_rating=hotel.star_rating,
-                    hotel_review_count=hotel.review_count,
                 ))
                 continue
             
             # Process each offer for this room
             for offer in offers:
                 try:
-                    # Extract price from new API format
-                    price_obj = offer.get('price', {})
-                    price = None
-                    if isinstance(price_obj, dict):
-                        # Try new API format first: price.final.amountNumber
-                        final_price = price_obj.get('final', {})
-                        if isinstance(final_price, dict):
-                            price = final_price.get('amountNumber') or final_price.get('amount')
-                        
-                        # Fallback to old format if not found
-                        if not price:
-                            price = price_obj.get('perNight', {}).get('exclusive', {}).get('display')
-                        if not price:
-                            price = price_obj.get('perRoomPerNight', {}).get('exclusive', {}).get('display')
+                    # Extract price: new API format (price.final.amountNumber) first, then old formats
+                    price_obj = offer.get('price')
+                    final_price = _dig(price_obj, 'final')
+                    price = (
+                        _dig(final_price, 'amountNumber')
+                        or _dig(final_price, 'amount')
+                        or _dig(price_obj, 'perNight', 'exclusive', 'display')
+                        or _dig(price_obj, 'perRoomPerNight', 'exclusive', 'display')
+                    )
                     
-                    # Extract amenities from offer benefits (each offer has its own amenities)
+                    # Single pass over offer benefits: amenities, meal plan and a cancellation fallback
+                    # (each offer has its own amenities)
                     amenities = []
-                    benefits = offer.get('benefits', [])
-                    for benefit in benefits:
-                        if isinstance(benefit, dict):
-                            benefit_text = benefit.get('text')
-                            if benefit_text and isinstance(benefit_text, str):
-                                amenities.append(benefit_text)
-                    
-                    # Extract meal plan and cancellation
                     meal_plan = None
-                    cancellation_policy = None
+                    benefit_cancellation = None
+                    for benefit in offer.get('benefits', ()):
+                        if not isinstance(benefit, dict):
+                            continue
+                        benefit_text = benefit.get('text')
+                        if not benefit_text or not isinstance(benefit_text, str):
+                            continue
+                        amenities.append(benefit_text)
+                        text_lower = benefit_text.lower()
+                        if meal_plan is None and ('breakfast' in text_lower or 'meal' in text_lower):
+                            meal_plan = benefit_text
+                        if benefit_cancellation is None and ('cancel' in text_lower or 'refund' in text_lower):
+                            benefit_cancellation = benefit_text
                     
-                    # First, check policies array for cancellation (more structured/reliable)
-                    policies = offer.get('policies', [])
-                    for policy in policies:
+                    # Cancellation: policies array first (more structured/reliable)
+                    cancellation_policy = None
+                    for policy in offer.get('policies', ()):
                         if isinstance(policy, dict):
                             name = policy.get('name', '').lower()
-                            if 'Cancellation policy' in name or 'cancel' in name or 'refund' in name:
+                            if 'cancel' in name or 'refund' in name:
                                 # Extract from descriptions array - first element is usually the short form
-                                descriptions = policy.get('descriptions', [])
-                                if descriptions and len(descriptions) > 0:
+                                descriptions = policy.get('descriptions')
+                                if descriptions:
                                     cancellation_policy = descriptions[0]  # "Free Cancellation"
-                                else:
-                                    cancellation_policy = None
                                 break
                     
-                    # Fallback: check benefits array for cancellation
+                    # Fallback: cancellation text found in benefits
                     if not cancellation_policy:
-                        for benefit in benefits:
-                            if isinstance(benefit, dict):
-                                text = benefit.get('text', '').lower()
-                                if 'Cancellation' in text or 'Cancellation policy' in text or 'cancel' in text or 'refund' in text:
-                                    cancellation_policy = benefit.get('text')
-                                    break
+                        cancellation_policy = benefit_cancellation
                     
                     # Additional fallback: check bookingDetails.isFreeCancellation
                     if not cancellation_policy:
@@ -271,29 +636,17 @@ def parse_room_grid_api(json_data: dict, hotel: HotelInfo, date_str: str) -> lis
                             if is_free_cancellation:
                                 cancellation_policy = "Free Cancellation"
                     
-                    # Extract meal plan from benefits
-                    for benefit in benefits:
-                        if isinstance(benefit, dict):
-                            text = benefit.get('text', '').lower()
-                            if 'breakfast' in text or 'meal' in text:
-                                meal_plan = benefit.get('text')
-                                break
-                    
-                    # Extract currency from price object
-                    currency = "INR"  # Default
-                    if isinstance(price_obj, dict):
-                        final_price = price_obj.get('final', {})
-                        if isinstance(final_price, dict):
-                            currency_code = final_price.get('currency', '₹')
-                            currency_map = {'₹': 'INR', '$': 'USD', '€': 'EUR', '£': 'GBP'}
-                            currency = currency_map.get(currency_code, 'INR')
+                    # Extract currency from price object (defaults to INR)
+                    currency_map = {'₹': 'INR', '$': 'USD', '€': 'EUR', '£': 'GBP'}
+                    currency = currency_map.get(_dig(final_price, 'currency'), 'INR')
                     availability_count = None
+                    price_value = float(price) if price else None
+                    
                     # Create room data
-                    rooms.append(RoomData(
-                        hotel_name=hotel.name,
-                        date=date_str,
+                    _append(RoomData(
+                        **base,
                         room_type=room_name,
-                        price=float(price) if price else None,
+                        price=price_value,
                         currency=currency,
                         amenities=amenities,  # FIXED: Extract from offer benefits, not room facilities
                         is_available=True,
@@ -302,10 +655,6 @@ def parse_room_grid_api(json_data: dict, hotel: HotelInfo, date_str: str) -> lis
                         meal_plan=meal_plan,
                         bed_type=bed_type,
                         max_occupancy=max_occupancy,
-                        hotel_location=hotel.location,
-                        hotel_rating=hotel.rating,
-                        hotel_star_rating=hotel.star_rating,
-                        hotel_review_count=hotel.review_count,
                     ))
                     
                     logger.debug(f"Parsed room offer: {room_name} - ₹{price}")
@@ -318,7 +667,6 @@ def parse_room_grid_api(json_data: dict, hotel: HotelInfo, date_str: str) -> lis
             logger.warning(f"Error parsing room from room-grid API: {e}")
             continue
     return rooms
-    # return deduplicate_rooms(rooms)
 
 
 def parse_room_json(json_data: dict, hotel: HotelInfo, date_str: str) -> list[RoomData]:
@@ -334,29 +682,21 @@ def parse_room_json(json_data: dict, hotel: HotelInfo, date_str: str) -> list[Ro
         List of RoomData objects
     """
     rooms = []
+    _append = rooms.append  # bound once; called for every offer
     
-    # NEW API FORMAT: Check for room-grid v1 format first
-    if 'rooms' in json_data and isinstance(json_data.get('rooms'), list):
-        # Check if this is the new format (has 'propertyId', 'propertyName', etc.)
-        if 'propertyId' in json_data or 'propertyName' in json_data:
+    # NEW API FORMAT: room-grid v1 (top-level 'rooms' list plus property fields)
+    if isinstance(json_data.get('rooms'), list):
+        if _dig(json_data, 'propertyId') is not None or _dig(json_data, 'propertyName') is not None:
             logger.info(f"Detected NEW room-grid API format for {hotel.name}")
             return parse_room_grid_api(json_data, hotel, date_str)
     
-    # LEGACY API FORMAT: Navigate to masterRooms array
-    # The data might be at different paths depending on the API endpoint
+    # LEGACY API FORMAT: masterRooms sits at different paths depending on the endpoint
     master_rooms = None
-    
-    # Try different possible paths
-    if 'roomGridData' in json_data:
-        room_grid = json_data.get('roomGridData', {})
-        if isinstance(room_grid, dict):
-            master_rooms = room_grid.get('masterRooms', [])
-    elif 'datelessMasterRoomInfo' in json_data:
-        master_rooms = json_data.get('datelessMasterRoomInfo', [])
-    elif 'masterRooms' in json_data:
-        master_rooms = json_data.get('masterRooms', [])
-    elif 'data' in json_data and isinstance(json_data['data'], dict):
-        master_rooms = json_data['data'].get('masterRooms', [])
+    for path in _LEGACY_PATHS:
+        master_rooms = _dig(json_data, *path)
+        if master_rooms:
+            # An empty list under one key must not hide rooms stored under a later one
+            break
     
     if not master_rooms:
         logger.warning(f"No masterRooms found in legacy JSON for {hotel.name}")
@@ -364,6 +704,9 @@ def parse_room_json(json_data: dict, hotel: HotelInfo, date_str: str) -> list[Ro
     
     logger.debug(f"Found {len(master_rooms)} master rooms in JSON")
     
+    # Hotel/date fields shared by every RoomData built below
+    base = _room_base(hotel, date_str)
+    
     for master_room in master_rooms:
         try:
             # Extract room name (already clean!)
@@ -406,14 +749,13 @@ def parse_room_json(json_data: dict, hotel: HotelInfo, date_str: str) -> list[Ro
                         elif isinstance(amenity, str):
                             amenities.append(amenity)
                 
-                amenities = [a.strip() for a in amenities if a and isinstance(a, str) and a.strip()]
-                amenities = list(set(amenities))
+                amenities = list(dict.fromkeys(a.strip() for a in amenities if a and isinstance(a, str) and a.strip()))
+                price_value = float(price) if price else None
                 
-                rooms.append(RoomData(
-                    hotel_name=hotel.name,
-                    date=date_str,
+                _append(RoomData(
+                    **base,
                     room_type=room_name,
-                    price=float(price) if price else None,
+                    price=price_value,
                     currency="INR",
                     amenities=amenities,
                     is_available=is_available,
@@ -422,10 +764,6 @@ def parse_room_json(json_data: dict, hotel: HotelInfo, date_str: str) -> list[Ro
                     meal_plan=None,
                     bed_type=bed_type,
                     max_occupancy=max_occupancy,
-                    hotel_location=hotel.location,
-                    hotel_rating=hotel.rating,
-                    hotel_star_rating=hotel.star_rating,
-                    hotel_review_count=hotel.review_count,
                 ))
                 continue
             
@@ -494,8 +832,7 @@ def parse_room_json(json_data: dict, hotel: HotelInfo, date_str: str) -> list[Ro
                                                 amenities.append(facility_title)
                     
                     # Clean amenities
-                    amenities = [a.strip() for a in amenities if a and isinstance(a, str) and a.strip()]
-                    amenities = list(set(amenities))
+                    amenities = list(dict.fromkeys(a.strip() for a in amenities if a and isinstance(a, str) and a.strip()))
                     
                     # Extract cancellation policy from this offer
                     cancellation_policy = None
@@ -513,7 +850,7 @@ def parse_room_json(json_data: dict, hotel: HotelInfo, date_str: str) -> list[Ro
                         elif not cancellation_policy:
                             cancellation_desc = cancellation_obj.get('description')
                             if cancellation_desc and isinstance(cancellation_desc, str):
-                                clean_desc = re.sub(r'<[^>]+>', '', cancellation_desc)
+                                clean_desc = _RE_HTML_TAG.sub('', cancellation_desc)
                                 clean_desc = clean_desc.strip()
                                 if clean_desc:
                                     cancellation_policy = clean_desc
@@ -559,11 +896,12 @@ def parse_room_json(json_data: dict, hotel: HotelInfo, date_str: str) -> list[Ro
                         currency = currency_map.get(currency_code, 'INR')
                     
                     # Create RoomData object for this offer
+                    price_value = float(price) if price else None
+                    
                     room_data = RoomData(
-                        hotel_name=hotel.name,
-                        date=date_str,
+                        **base,
                         room_type=room_name,
-                        price=float(price) if price else None,
+                        price=price_value,
                         currency=currency,
                         amenities=amenities,
                         is_available=is_available,
@@ -572,13 +910,9 @@ def parse_room_json(json_data: dict, hotel: HotelInfo, date_str: str) -> list[Ro
                         meal_plan=meal_plan,
                         bed_type=bed_type,
                         max_occupancy=max_occupancy,
-                        hotel_location=hotel.location,
-                        hotel_rating=hotel.rating,
-                        hotel_star_rating=hotel.star_rating,
-                        hotel_review_count=hotel.review_count,
                     )
                     
-                    rooms.append(room_data)
+                    _append(room_data)
                     
                 except Exception as e:
                     logger.warning(f"Error parsing offer for {room_name}: {e}")
@@ -589,7 +923,94 @@ def parse_room_json(json_data: dict, hotel: HotelInfo, date_str: str) -> list[Ro
             logger.warning(f"Error parsing master room from JSON: {e}")
             continue
     return rooms
-    # return deduplicate_rooms(rooms)
+
+
+def save_api_sample(sample_path: str, json_response: dict) -> bool:
+    """
+    Write an intercepted API response to disk unless a sample already exists.
+    
+    Blocking; run it via asyncio.to_thread from async code.
+    
+    Returns:
+        True if the sample was written
+    """
+    if os.path.exists(sample_path):
+        return False
+    os.makedirs(os.path.dirname(sample_path), exist_ok=True)
+    with open(sample_path, 'wb') as f:
+        f.write(orjson.dumps(json_response, option=orjson.OPT_INDENT_2))
+    return True
+
+
+# Header names containing any of these carry credentials; kept out of saved templates by default
+_SENSITIVE_HEADER_PARTS = ('auth', 'token', 'cookie', 'session', 'csrf', 'key')
+
+
+def save_api_template(template_path: str, template: dict, storage_state: Optional[dict] = None):
+    """
+    Write a captured room API template to disk so later runs can fetch rooms
+    without a browser.
+    
+    Credential-bearing headers are dropped unless storage_state is given: passing
+    the session cookies is the caller's explicit opt-in to persisting credentials
+    in plaintext.
+    
+    Blocking; run it via asyncio.to_thread from async code.
+    
+    Args:
+        template_path: Output JSON path
+        template: Dict from capture_api_template
+        storage_state: Optional BrowserContext.storage_state() with the cookies
+    """
+    os.makedirs(os.path.dirname(template_path) or ".", exist_ok=True)
+    headers = template['headers']
+    if storage_state is None:
+        headers = {
+            key: value for key, value in headers.items()
+            if not any(part in key.lower() for part in _SENSITIVE_HEADER_PARTS)
+        }
+    data = {
+        **template,
+        'headers': headers,
+        'check_in': template['check_in'].isoformat(),
+        'storage_state': storage_state,
+    }
+    with open(template_path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
+def load_api_template(template_path: str) -> tuple[dict, Optional[dict]]:
+    """
+    Read a template written by save_api_template.
+    
+    Blocking; run it via asyncio.to_thread from async code.
+    
+    Returns:
+        (template, storage_state) - the storage state is None if none was saved
+    """
+    with open(template_path, 'rb') as f:
+        data = orjson.loads(f.read())
+    storage_state = data.pop('storage_state', None)
+    data['check_in'] = datetime.fromisoformat(data['check_in'])
+    return data, storage_state
+
+
+# Set once the debug output directory has been created
+_debug_dir_ready = False
+
+
+def write_debug_html(debug_path: str, html: str):
+    """
+    Write debug HTML to disk, creating its directory on first use.
+    
+    Blocking; run it via asyncio.to_thread from async code.
+    """
+    global _debug_dir_ready
+    if not _debug_dir_ready:
+        os.makedirs(os.path.dirname(debug_path), exist_ok=True)
+        _debug_dir_ready = True
+    with open(debug_path, "w", encoding="utf-8") as f:
+        f.write(html)
 
 
 async def scrape_hotel_rooms(
@@ -598,6 +1019,7 @@ async def scrape_hotel_rooms(
     check_in: datetime,
     config: ScraperConfig,
     session_id: Optional[str] = None,
+    api_template: Optional[dict] = None,
 ) -> list[RoomData]:
     """
     Scrape room information for a specific hotel and date using JSON API interception.
@@ -609,11 +1031,14 @@ async def scrape_hotel_rooms(
         check_in: Check-in date
         config: Scraper configuration
         session_id: Optional session ID for debugging
+        api_template: Optional dict filled with the room API request that produced
+                      the rooms, so later dates can replay it (see fetch_rooms_via_api)
     
     Returns:
         List of RoomData objects for all available rooms
     """
     check_out = check_in + timedelta(days=1)
+    date_str = check_in.date().isoformat()
     
     # Build URL with dates
     url = build_hotel_url_with_dates(
@@ -627,16 +1052,22 @@ async def scrape_hotel_rooms(
     logger.debug(f"Navigating to hotel page: {url}")
 
     # Storage for API data
-    api_data = {'received': False, 'json': None, 'legacy_received': False, 'room_grid_received': False}
+    api_data = {'received': False, 'json': None, 'request': None, 'legacy_received': False, 'room_grid_received': False}
+    # Set when the legacy API response has been handled / when any usable room JSON is captured
+    legacy_event = asyncio.Event()
+    api_event = asyncio.Event()
     
     async def intercept_room_api(response):
         """Intercept and capture room data API response. Prioritizes legacy API over room-grid API."""
         try:
+            url_str = response.url
+            if "BelowFoldParams/GetSecondaryData" not in url_str and "/api/v1/property/room-grid" not in url_str:
+                return
+            
             # If the page/context is closing, skip expensive response parsing to avoid protocol errors
             if page.is_closed():
                 return
             
-            url_str = response.url
             # PRIORITY 1: Legacy API endpoints (BelowFoldParams/GetSecondaryData)
             if "BelowFoldParams/GetSecondaryData" in url_str:
                 status = response.status
@@ -650,7 +1081,7 @@ async def scrape_hotel_rooms(
                             await response.finished()
                         except Exception:
                             pass
-                        json_response = await response.json()
+                        json_response = orjson.loads(await response.body())
                         # Check if this old endpoint actually contains room data (not just empty arrays)
                         rooms_count = 0
                         if isinstance(json_response, dict):
@@ -669,24 +1100,25 @@ async def scrape_hotel_rooms(
                             # Always prioritize legacy API - overwrite if room-grid API was already captured
                             api_data['json'] = json_response
                             api_data['received'] = True
+                            api_data['request'] = response.request
+                            api_event.set()
+                            # Nothing can outrank the legacy API, so stop listening to the remaining traffic
+                            detach_interceptor()
                             logger.info(f"[JSON API] ✅ {hotel.name} - Captured {rooms_count} rooms from legacy API (PRIORITY)")
                         else:
                             logger.debug(f"[JSON API] ⚠️  {hotel.name} - legacy API has no rooms (sold out or wrong endpoint)")
                         
-                        # Save sample for debugging (optional - first time only)
-                        if session_id:
-                            api_samples_dir = "output/api_samples"
-                            os.makedirs(api_samples_dir, exist_ok=True)
-                            sample_path = os.path.join(api_samples_dir, f"{session_id}_sample.json")
-                            if not os.path.exists(sample_path):
-                                with open(sample_path, 'w', encoding='utf-8') as f:
-                                    json.dump(json_response, f, indent=2, ensure_ascii=False)
+                        # Save sample for debugging (opt-in via config.debug_html - first time only)
+                        if session_id and config.debug_html:
+                            sample_path = os.path.join("output", "api_samples", f"{session_id}_sample.json")
+                            if await asyncio.to_thread(save_api_sample, sample_path, json_response):
                                 logger.debug(f"Saved API sample to {sample_path}")
                                     
                     except Exception as e:
                         logger.warning(f"[JSON API] Parse error for {hotel.name}: {e}")
                 else:
                     logger.warning(f"[JSON API] ❌ {hotel.name} - Legacy API Status {status}")
+                legacy_event.set()
             # PRIORITY 2: Fallback to room-grid API (only if legacy API wasn't received or had no rooms)
             elif "/api/v1/property/room-grid" in url_str:
                 status = response.status
@@ -702,13 +1134,15 @@ async def scrape_hotel_rooms(
                                 await response.finished()
                             except Exception:
                                 pass
-                            json_response = await response.json()
+                            json_response = orjson.loads(await response.body())
                             # Check if response contains actual room data
                             if isinstance(json_response, dict) and 'rooms' in json_response:
                                 rooms_count = len(json_response.get('rooms', []))
                                 if rooms_count > 0:
                                     api_data['json'] = json_response
                                     api_data['received'] = True
+                                    api_data['request'] = response.request
+                                    api_event.set()
                                     logger.info(f"[JSON API] ✅ {hotel.name} - Captured {rooms_count} rooms from room-grid API (FALLBACK)")
                                 else:
                                     logger.info(f"[JSON API] ⚠️  {hotel.name} - room-grid API returned 0 rooms (sold out: {json_response.get('isSoldOut', False)})")
@@ -726,7 +1160,30 @@ async def scrape_hotel_rooms(
         except Exception as e:
             logger.debug(f"Response intercept error: {e}")
 
-    page.on("response", intercept_room_api)
+    # Strong references to in-flight handler tasks (the event loop only keeps weak ones)
+    interceptor_tasks = set()
+
+    def on_response(response):
+        """Filter by URL synchronously so unrelated responses never spawn a handler task."""
+        url_str = response.url
+        if "BelowFoldParams/GetSecondaryData" in url_str or "/api/v1/property/room-grid" in url_str:
+            task = asyncio.ensure_future(intercept_room_api(response))
+            interceptor_tasks.add(task)
+            task.add_done_callback(interceptor_tasks.discard)
+
+    def detach_interceptor():
+        """Remove the response listener and cancel handlers still in flight (safe to call more than once)."""
+        try:
+            page.remove_listener("response", on_response)
+        except Exception:
+            pass
+        # Called from a handler once the legacy API is captured; don't cancel that handler itself
+        current = asyncio.current_task()
+        for task in list(interceptor_tasks):
+            if task is not current:
+                task.cancel()
+
+    page.on("response", on_response)
 
     try:
         # Add random delay before navigation to appear more human-like
@@ -734,23 +1191,17 @@ async def scrape_hotel_rooms(
 
         nav_attempts = 3
         nav_timeout_ms = 120000
-        navigation_ready_selector = (
-            '[data-selenium*="room"], [data-element-name*="room"], #rooms, #roomsAndRates'
-        )
 
         last_nav_error = None
         for attempt in range(nav_attempts):
             try:
+                # Return as soon as the response commits; the room API events below
+                # gate on actual data, not on every subresource finishing
                 await page.goto(
                     url,
-                    wait_until="domcontentloaded",
+                    wait_until="commit",
                     timeout=nav_timeout_ms,
                 )
-                # Lightweight wait for a room-related element; ignore if it never appears
-                try:
-                    await page.wait_for_selector(navigation_ready_selector, timeout=8000)
-                except Exception:
-                    pass
                 break
             except Exception as nav_err:
                 last_nav_error = nav_err
@@ -763,57 +1214,70 @@ async def scrape_hotel_rooms(
                 else:
                     raise last_nav_error
 
-        await asyncio.sleep(3)  # Increased initial wait
-        
-        # Dismiss any popups
-        await dismiss_hotel_popups(page)
+        # Event-driven instead of polling the DOM for room elements: go on as soon as the
+        # room API response arrives, or once the document is parsed (up to 8s)
+        async def dom_parsed():
+            try:
+                await page.wait_for_load_state("domcontentloaded", timeout=8000)
+            except Exception:
+                pass
         
-        # Scroll to trigger lazy loading and API calls
-        for i in range(3):
-            await page.evaluate(f"window.scrollTo(0, document.body.scrollHeight * {(i+1)/4})")
-            await asyncio.sleep(1)
+        first_signal = [asyncio.ensure_future(api_event.wait()), asyncio.ensure_future(dom_parsed())]
+        await asyncio.wait(first_signal, timeout=8, return_when=asyncio.FIRST_COMPLETED)
+        for waiter in first_signal:
+            waiter.cancel()
         
-        # Wait for network to settle
+        # Resume as soon as a room API answers instead of a fixed pause
         try:
-            await page.wait_for_load_state("networkidle", timeout=15000)
-        except Exception:
+            await asyncio.wait_for(api_event.wait(), timeout=3)
+        except asyncio.TimeoutError:
             pass
         
+        # Once the legacy API has been handled and room JSON is in hand nothing else
+        # can change the result, so skip the page interaction entirely
+        if not (legacy_event.is_set() and api_event.is_set()):
+            # Dismiss any popups
+            await dismiss_hotel_popups(page)
+            
+            # Scroll to trigger lazy loading and API calls. The page may only have
+            # committed here (no body yet, or mid-navigation), so a failed scroll
+            # must not throw away rooms already captured from the API
+            try:
+                await page.evaluate(_STEP_SCROLL_JS, [3, 4, 1000])
+            except Exception as e:
+                logger.debug(f"Scroll failed for {hotel.name}: {e}")
+        
         # STEP 1: Wait for legacy API first (up to 7 seconds)
         logger.debug(f"[API Wait] Waiting for legacy API for {hotel.name}...")
-        for _ in range(7):
-            if api_data['legacy_received']:
-                # Legacy API was called, check if we got data
-                if api_data['received'] and api_data['json']:
-                    logger.debug(f"[API Wait] Legacy API provided rooms for {hotel.name}")
-                    break  # Got legacy API with rooms
-                # Legacy API was called but no rooms yet, wait a bit more then check again
-                await asyncio.sleep(0.5)
-                if api_data['received'] and api_data['json']:
-                    break  # Got rooms after the wait
-            await asyncio.sleep(1)
+        try:
+            await asyncio.wait_for(legacy_event.wait(), timeout=7)
+        except asyncio.TimeoutError:
+            pass
         
         # STEP 2: If legacy API didn't provide rooms, wait for room-grid API (up to 5 more seconds)
-        if not api_data['received'] or not api_data['json']:
+        if not api_event.is_set():
             if api_data['legacy_received']:
                 logger.debug(f"[API Wait] Legacy API called but no rooms found, waiting for room-grid API for {hotel.name}...")
             else:
                 logger.debug(f"[API Wait] Legacy API not called, waiting for room-grid API for {hotel.name}...")
             
-            for _ in range(5):
-                if api_data['received']:
-                    break
-                await asyncio.sleep(1)
-        
-        date_str = check_in.strftime("%Y-%m-%d")
+            try:
+                await asyncio.wait_for(api_event.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                pass
         
         # Try JSON parsing first
         if api_data['received'] and api_data['json']:
             logger.info(f"[Parser] Using JSON API for {hotel.name}")
-            rooms = parse_room_json(api_data['json'], hotel, date_str)
+            # Parse in a worker thread so other pages keep making progress on the event loop
+            rooms = await asyncio.to_thread(parse_room_json, api_data['json'], hotel, date_str)
             
             if rooms:
                 logger.info(f"[JSON Success] {hotel.name}: {len(rooms)} rooms extracted")
+                if api_template is not None and api_data['request'] is not None:
+                    template = await capture_api_template(api_data['request'], check_in)
+                    if template:
+                        api_template.update(template)
                 return rooms
             else:
                 logger.warning(f"[JSON Empty] {hotel.name}: No valid rooms in JSON, falling back to HTML")
@@ -898,44 +1362,246 @@ async def scrape_hotel_rooms(
     except Exception as e:
         logger.error(f"Error scraping rooms for {hotel.name}: {e}")
         return [RoomData(
-            hotel_name=hotel.name,
-            date=check_in.strftime("%Y-%m-%d"),
+            **_room_base(hotel, date_str),
             room_type="Error",
             price=None,
             currency=hotel.currency,
             amenities=[],
             is_available=False,
-            hotel_location=hotel.location,
-            hotel_rating=hotel.rating,
-            hotel_star_rating=hotel.star_rating,
-            hotel_review_count=hotel.review_count,
         )]
+    finally:
+        # The page is reused for the next date; don't leave this date's listener or handlers behind
+        detach_interceptor()
+        if interceptor_tasks:
+            await asyncio.gather(*interceptor_tasks, return_exceptions=True)
+
+
+# Headers the API request context sets itself (cookies come from the shared browser context)
+_REPLAY_SKIP_HEADERS = frozenset({'cookie', 'content-length', 'host', 'connection', 'accept-encoding'})
+
+
+def _shift_dates(text: Optional[str], old_in: str, old_out: str, new_in: str, new_out: str) -> Optional[str]:
+    """Swap the check-in/check-out dates in a captured URL or body in one pass."""
+    if not text:
+        return text
+    mapping = {old_in: new_in, old_out: new_out}
+    return re.sub(f"{old_in}|{old_out}", lambda m: mapping[m.group()], text)
+
+
+async def capture_api_template(request, check_in: datetime) -> Optional[dict]:
+    """
+    Record a room API request so it can be replayed for other dates.
+    
+    Args:
+        request: Playwright request that returned the room JSON
+        check_in: Check-in date the request was made for
+    
+    Returns:
+        Template dict (method, url, headers, post_data, check_in), or None if the
+        request doesn't carry the check-in date and so can't be retargeted
+    """
+    try:
+        date_str = check_in.date().isoformat()
+        post_data = request.post_data
+        if date_str not in request.url and (not post_data or date_str not in post_data):
+            logger.debug(f"[API Replay] Captured request has no {date_str} to rewrite; replay disabled")
+            return None
+        headers = {
+            key: value
+            for key, value in (await request.all_headers()).items()
+            if not key.startswith(':') and key.lower() not in _REPLAY_SKIP_HEADERS
+        }
+        return {
+            'method': request.method,
+            'url': request.url,
+            'headers': headers,
+            'post_data': post_data,
+            'check_in': check_in,
+        }
+    except Exception as e:
+        logger.debug(f"[API Replay] Could not capture request: {e}")
+        return None
+
+
+async def fetch_rooms_via_api(
+    request_context: APIRequestContext,
+    template: dict,
+    hotel: HotelInfo,
+    check_in: datetime,
+) -> Optional[list[RoomData]]:
+    """
+    Fetch rooms for a date by replaying a captured room API request, skipping page rendering.
+    
+    With a browser context's API client (context.request) the request carries
+    the same cookies as the warmed-up page; a standalone client from
+    playwright.request.new_context(storage_state=...) works without a browser.
+    
+    Args:
+        request_context: Playwright API request context to send the request with
+        template: Dict from capture_api_template or load_api_template
+        hotel: Hotel information
+        check_in: Check-in date to request
+    
+    Returns:
+        List of RoomData objects, or None if the replay failed and the caller
+        should fall back to navigating the page
+    """
+    old_in = template['check_in']
+    shift = (
+        old_in.date().isoformat(),
+        (old_in + timedelta(days=1)).date().isoformat(),
+        check_in.date().isoformat(),
+        (check_in + timedelta(days=1)).date().isoformat(),
+    )
+    try:
+        response = await request_context.fetch(
+            _shift_dates(template['url'], *shift),
+            method=template['method'],
+            headers=template['headers'],
+            data=_shift_dates(template['post_data'], *shift),
+            timeout=30000,
+        )
+        if response.status != 200:
+            logger.warning(f"[API Replay] {hotel.name} {check_in.date()} - status {response.status}, falling back to page")
+            return None
+        json_response = orjson.loads(await response.body())
+    except Exception as e:
+        logger.warning(f"[API Replay] {hotel.name} {check_in.date()} - {e}, falling back to page")
+        return None
+    
+    if not isinstance(json_response, dict):
+        return None
+    rooms = await asyncio.to_thread(parse_room_json, json_response, hotel, shift[2])
+    if not rooms:
+        logger.info(f"[API Replay] {hotel.name} {check_in.date()} - no rooms in replayed response, falling back to page")
+        return None
+    logger.info(f"[API Replay] ✅ {hotel.name} {check_in.date()} - {len(rooms)} rooms")
+    return rooms
+
+
+async def fetch_many_via_api(
+    request_context: APIRequestContext,
+    template: dict,
+    hotel: HotelInfo,
+    check_ins: list[datetime],
+    concurrency: int,
+    delay_range: Optional[tuple[float, float]] = None,
+    on_rooms_scraped: Optional[Callable[[list[RoomData]], None]] = None,
+) -> list[Optional[list[RoomData]]]:
+    """
+    Replay a captured room API request for many dates, `concurrency` at a time.
+    
+    All requests share one API client, so they reuse its cookies and its
+    pooled connections to the site instead of opening a page each.
+    
+    Args:
+        request_context: Playwright API request context (e.g. context.request)
+        template: Dict from capture_api_template
+        hotel: Hotel information
+        check_ins: Check-in dates to fetch
+        concurrency: Maximum number of requests in flight
+        delay_range: Optional (min, max) seconds of jitter before each request
+        on_rooms_scraped: Optional callback run as soon as a date's replay succeeds
+    
+    Returns:
+        Per date (in input order): list of RoomData, or None where the replay failed
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def fetch_one(check_in: datetime) -> Optional[list[RoomData]]:
+        async with semaphore:
+            if delay_range:
+                await random_delay(*delay_range)
+            rooms = await fetch_rooms_via_api(request_context, template, hotel, check_in)
+        if on_rooms_scraped and rooms:
+            on_rooms_scraped(rooms)
+        return rooms
+    
+    return await asyncio.gather(*(fetch_one(check_in) for check_in in check_ins))
+
+
+async def scrape_many(
+    context: BrowserContext,
+    jobs: list[tuple],
+    concurrency: int,
+    on_rooms_scraped: Optional[Callable[[list[RoomData]], None]] = None,
+    delay_range: Optional[tuple[float, float]] = None,
+) -> list[list[RoomData]]:
+    """
+    Run scrape_hotel_rooms for many jobs concurrently on one browser context.
+    
+    Jobs share a pool of at most `concurrency` pages that are reused across
+    jobs; each job has a page to itself while it runs, and scrape_hotel_rooms
+    detaches its response interceptor when done, so the listener stays scoped
+    to that hotel/date.
+    
+    Args:
+        context: Browser context to open pages in
+        jobs: (hotel, check_in, config, session_id) tuples
+        concurrency: Maximum number of pages scraping at the same time
+        on_rooms_scraped: Optional callback run as soon as each job finishes
+                          (completion order), with that job's rooms
+        delay_range: Optional (min, max) seconds of jitter before every job but the
+                     first, so concurrent pages don't hit the site in lockstep
+    
+    Returns:
+        One list of RoomData per job, in job order
+    """
+    results: list[list[RoomData]] = [[] for _ in jobs]
+    
+    def on_done(index: int, rooms: Optional[list[RoomData]], error: Optional[Exception]) -> bool:
+        if error is not None:
+            raise error
+        results[index] = rooms
+        # Hand each job's rooms on as soon as it finishes instead of after the slowest one
+        if on_rooms_scraped and rooms:
+            on_rooms_scraped(rooms)
+        return False
+    
+    await run_on_page_pool(
+        context,
+        jobs,
+        lambda page, job: scrape_hotel_rooms(page, *job),
+        on_done,
+        concurrency,
+        delay_range,
+    )
+    return results
 
 
 async def dismiss_hotel_popups(page: Page):
     """Dismiss popups on hotel detail pages."""
-    popup_selectors = [
-        '[data-selenium="close-button"]',
-        '.ab-close-button',
-        '[aria-label="Close"]',
-        'button[class*="close"]',
-        '.Modal__Close',
-        '#onetrust-accept-btn-handler',
-        '[data-element-name="close-button"]',
-    ]
-    
-    for selector in popup_selectors:
-        try:
-            await safe_click(page, selector, timeout=1000)
-            await random_delay(0.2, 0.4)
-        except Exception:
-            pass
+    # One round-trip: click every visible match in the page instead of waiting on each selector
+    try:
+        dismissed = await page.evaluate('''(selectors) => {
+            const clicked = [];
+            for (const selector of selectors) {
+                const el = document.querySelector(selector);
+                if (el && el.offsetParent !== null) {
+                    el.click();
+                    clicked.push(selector);
+                }
+            }
+            return clicked;
+        }''', list(_POPUP_SELECTORS))
+        if dismissed:
+            logger.debug(f"Dismissed popups: {dismissed}")
+    except Exception:
+        pass
 
 
-async def wait_for_room_listings(page: Page, timeout: int = 30000) -> bool:
-    """Wait for room listings to appear on the page."""
-    import os
+async def wait_for_room_listings(page: Page, timeout: int = 30000, debug_html: bool = False) -> bool:
+    """
+    Wait for room listings to appear on the page.
     
+    Args:
+        page: Playwright page instance
+        timeout: Milliseconds for each of the room selector wait and the in-browser poll
+        debug_html: Save the rendered page to output/debug_no_rooms.html when no rooms appear
+    
+    Returns:
+        True if room listings were found
+    """
     # First, wait for initial page load
     try:
         await page.wait_for_load_state("domcontentloaded", timeout=10000)
@@ -957,35 +1623,20 @@ async def wait_for_room_listings(page: Page, timeout: int = 30000) -> bool:
     # except Exception:
     #     pass
     # Try to click on the "Rooms" section/tab to trigger room loading
-    rooms_tab_selectors = [
-        'a:has-text("Rooms")',
-        'button:has-text("Rooms")',
-        '[data-element-name*="rooms"]',
-        '[href*="#rooms"]',
-        'a[href*="roomsAndRates"]',
-        '[data-selenium*="room"]',
-        # Scroll to rooms section anchor
-        '#roomsAndRates',
-        '#rooms',
-    ]
-    
-    for selector in rooms_tab_selectors:
-        try:
-            elem = page.locator(selector).first
-            if await elem.is_visible(timeout=2000):
-                await elem.click()
-                logger.debug(f"Clicked rooms tab with selector: {selector}")
-                await asyncio.sleep(3)
-                break
-        except Exception:
-            continue
+    # (all probes checked in one round-trip, then a real click on the winner)
+    try:
+        index = await page.evaluate(_FIRST_VISIBLE_JS, [list(probe) for probe in _ROOMS_TAB_SELECTORS])
+        if index >= 0:
+            css, text = _ROOMS_TAB_SELECTORS[index]
+            selector = f'{css}:has-text("{text}")' if text else css
+            await page.locator(selector).first.click()
+            logger.debug(f"Clicked rooms tab with selector: {selector}")
+            await asyncio.sleep(3)
+    except Exception:
+        pass
     
     # Scroll down to the rooms section to trigger lazy loading
-    for i in range(5):
-        await page.evaluate(f'''() => {{
-            window.scrollTo(0, document.body.scrollHeight * {(i+1)/6});
-        }}''')
-        await asyncio.sleep(1.5)
+    await page.evaluate(_STEP_SCROLL_JS, [5, 6, 1500])
     
     # Wait for network to settle after scroll
     try:
@@ -995,104 +1646,48 @@ async def wait_for_room_listings(page: Page, timeout: int = 30000) -> bool:
     
     # Try a direct wait on typical room selectors before falling back to polling.
     # This helps ensure React has finished injecting the room grid into the DOM.
-    direct_room_selector = (
-        '[data-ppapi="room-price"], '
-        '[data-selenium="room-panel"], '
-        '[data-selenium="room-name"], '
-        '[data-testid*="room"], '
-        '[class*="RoomGridItem"]'
-    )
     try:
-        await page.wait_for_selector(direct_room_selector, timeout=timeout)
+        await page.wait_for_selector(_DIRECT_ROOM_SELECTOR, timeout=timeout)
         logger.debug("Room selector appeared via direct wait")
         return True
     except Exception:
         # Fall back to the more exhaustive polling logic below
         pass
     
-    # Additional wait for React to render
-    await asyncio.sleep(3)
-    
-    # Poll for room elements with retry
-    room_selectors = [
-        '[data-ppapi="room-price"]',  # Price elements (most reliable)
-        '[data-selenium="room-panel"]',
-        '[data-selenium="room-name"]',
-        '[data-element-name="room-item"]',
-        '.MasterRoom',
-        '.RoomGrid',
-        '#roomsAndRates',
-        '[class*="ChildRoomsList"]',
-        '[class*="RoomGridItem"]',
-        '[data-element-name*="room"]',
-        # Additional selectors
-        '[class*="room-grid"]',
-        '[class*="RoomList"]',
-        '[data-testid*="room"]',
-        '[class*="room-card"]',
-        'div[class*="room"]',
-        # Price-based detection
-        '[class*="Price"]',
-        '[data-element-name="final-price"]',
-    ]
-    
-    # Try multiple times with increasing wait
-    for attempt in range(5):
-        for selector in room_selectors:
-            try:
-                count = await page.locator(selector).count()
-                if count > 0:
-                    logger.debug(f"Found {count} room elements with selector: {selector}")
-                    # Wait a bit more for all rooms to load
-                    await asyncio.sleep(2)
-                    return True
-            except Exception:
-                continue
-        
-        # Scroll more with variable distance and wait
-        scroll_distance = random.randint(400, 800)
-        await page.evaluate(f"window.scrollBy(0, {scroll_distance})")
-        await random_delay(2, 4)  # Longer, variable delays
-    
-    # Final check: look for actual price patterns in visible text
+    # Poll in the browser instead of sleeping between attempts in Python: this returns as
+    # soon as any room selector (in priority order) or a rendered price is present
     try:
-        has_prices = await page.evaluate('''() => {
-            // Look for actual rendered price text like "₹" followed by numbers
-            const priceRegex = /₹\s*[\d,]{3,}/;
-            const bodyText = document.body.innerText;
-            return priceRegex.test(bodyText);
-        }''')
-        if has_prices:
-            logger.debug("Found price patterns in page text")
-            return True
+        handle = await page.wait_for_function(
+            _ROOMS_PRESENT_JS,
+            arg=list(_ROOM_POLL_SELECTORS),
+            timeout=timeout,
+            polling=500,
+        )
+        logger.debug(f"Found room elements via: {await handle.json_value()}")
+        # Wait a bit more for all rooms to load
+        await asyncio.sleep(2)
+        return True
     except Exception:
         pass
     
-    # Save debug HTML when rooms not found
-    try:
-        html = await page.content()
-        debug_path = "output/debug_no_rooms.html"
-        os.makedirs("output", exist_ok=True)
-        with open(debug_path, "w", encoding="utf-8") as f:
-            f.write(html)
-        logger.debug(f"Saved debug HTML to {debug_path}")
-    except Exception:
-        pass
+    # Save debug HTML when rooms not found (opt-in). The whole page is dumped: the room
+    # section is what's missing here, so a subtree dump would leave nothing to inspect
+    if debug_html:
+        try:
+            html = await page.content()
+            debug_path = "output/debug_no_rooms.html"
+            # Written off the event loop so concurrent pages keep scraping
+            await asyncio.to_thread(write_debug_html, debug_path, html)
+            logger.debug(f"Saved debug HTML to {debug_path}")
+        except Exception:
+            pass
     
     return False
 
 
 async def expand_room_listings(page: Page):
     """Click 'Show more rooms' button if present."""
-    expand_selectors = [
-        '[data-selenium="show-more-rooms"]',
-        'button[class*="ShowMore"]',
-        '[data-element-name="show-more-rooms"]',
-        'button:has-text("Show more")',
-        'a:has-text("Show all rooms")',
-    ]
-    
-    for selector in expand_selectors:
+    for selector in _EXPAND_SELECTORS:
         try:
             clicked = await safe_click(page, selector, timeout=1000)  # Reduced from 2000
             if clicked:
@@ -1115,54 +1710,41 @@ def parse_room_listings(html: str, hotel: HotelInfo, check_in: datetime) -> list
     Returns:
         List of RoomData objects
     """
-    soup = BeautifulSoup(html, "lxml")
-    rooms = []
-    hotel_name = hotel.name
-    date_str = check_in.strftime("%Y-%m-%d")
+    # Hotel/date fields shared by every RoomData built below
+    base = _room_base(hotel, check_in.date().isoformat())
     
     # Try multiple selector patterns for room containers
     # Based on Agoda's actual structure from browser inspection
-    room_selectors = [
-        {'tag': 'div', 'attrs': {'data-selenium': 'room-panel'}},
-        {'tag': 'div', 'attrs': {'data-element-name': 'room-item'}},
-        {'tag': 'div', 'attrs': {'data-selenium': 'room-item'}},
-        {'tag': 'div', 'attrs': {'class': re.compile(r'MasterRoom', re.I)}},
-        {'tag': 'tr', 'attrs': {'data-selenium': re.compile(r'room', re.I)}},
-        {'tag': 'div', 'attrs': {'class': re.compile(r'room.*grid|room.*item|RoomGrid', re.I)}},
-        # Additional selectors based on Agoda's actual structure
-        {'tag': 'div', 'attrs': {'data-ppapi': re.compile(r'room', re.I)}},
-        {'tag': 'section', 'attrs': {'data-element-name': re.compile(r'room', re.I)}},
-        # From accessibility tree: room containers have specific patterns
-        {'tag': 'div', 'attrs': {'class': re.compile(r'ChildRoomsList|RoomGridItem', re.I)}},
-        {'tag': 'div', 'attrs': {'class': re.compile(r'room-card|roomCard', re.I)}},
-        {'tag': 'div', 'attrs': {'data-testid': re.compile(r'room', re.I)}},
-    ]
-    
+    # First pass parses only room-related subtrees; if none match, reparse the whole page
+    # since the fallbacks below walk up from prices/names to their containers
     room_elements = []
-    for selector in room_selectors:
-        room_elements = soup.find_all(selector['tag'], attrs=selector['attrs'])
+    full_page = False  # whether `soup` holds the whole document
+    for parse_only in (_ROOM_STRAINER, None):
+        soup = BeautifulSoup(html, "lxml", parse_only=parse_only)
+        full_page = parse_only is None
+        # One traversal for all container selectors; the highest-priority rule with matches wins
+        for index, room_elements in _matches_by_rule(soup, *_ROOM_RULES):
+            logger.debug(f"Found {len(room_elements)} rooms using selector: {_ROOM_SELECTORS[index]}")
+            break
         if room_elements:
-            logger.debug(f"Found {len(room_elements)} rooms using selector: {selector}")
             break
     
     if not room_elements:
         # Try alternative approach: look for price elements and find their containers
-        price_elements = soup.find_all(attrs={'data-ppapi': 'room-price'})
-        if price_elements:
-            room_elements = [p.find_parent(['div', 'tr', 'section']) for p in price_elements if p.find_parent(['div', 'tr', 'section'])]
+        price_elements = _css('[data-ppapi="room-price"]').select(soup)
+        room_elements = [parent for p in price_elements if (parent := p.find_parent(['div', 'tr', 'section']))]
     
     if not room_elements:
         # Another approach: find room name elements and their containers
-        room_name_elements = soup.find_all(attrs={'data-selenium': 'room-name'})
-        if room_name_elements:
-            room_elements = [n.find_parent(['div', 'tr', 'section']) for n in room_name_elements if n.find_parent(['div', 'tr', 'section'])]
+        room_name_elements = _css('[data-selenium="room-name"]').select(soup)
+        room_elements = [parent for n in room_name_elements if (parent := n.find_parent(['div', 'tr', 'section']))]
     
     if not room_elements:
         # Last resort: look for elements with room-price data attribute specifically
         # This avoids picking up flight/cross-sell prices
-        price_elements = soup.find_all(attrs={'data-ppapi': 'room-price'})
+        # (price_elements is the room-price lookup from the first fallback)
         if not price_elements:
-            price_elements = soup.find_all(attrs={'data-element-name': 'final-price'})
+            price_elements = _css('[data-element-name="final-price"]').select(soup)
         
         for price_elem in price_elements:
             # Find the parent container for this room
@@ -1182,11 +1764,12 @@ def parse_room_listings(html: str, hotel: HotelInfo, check_in: datetime) -> list
                 if parent:
                     parent = parent.parent
     
-    # Parse each room
-    for room_elem in room_elements:
-        room_data = extract_room_data(room_elem, hotel, date_str)
-        if room_data:
-            rooms.append(room_data)
+    # Parse each room, deduplicating by room type (keep the one with lowest price) as they
+    # are extracted, so superseded RoomData objects are dropped right away
+    rooms = deduplicate_rooms(
+        room_data for room_elem in room_elements
+        if (room_data := extract_room_data(room_elem, base))
+    )
     
     # NOTE: Removed broad regex fallback that was extracting garbage like "king bed", "double bed"
     # Only extract from specific room elements with proper selectors
@@ -1196,72 +1779,58 @@ def parse_room_listings(html: str, hotel: HotelInfo, check_in: datetime) -> list
     # NEW FALLBACK: Extract room info from text patterns if no structured elements found
     if not rooms:
         logger.debug("Trying text-based room extraction as fallback")
-        rooms = extract_rooms_from_text(soup, hotel, date_str)
-    # Deduplicate by room type (keep the one with lowest price)
-    rooms = deduplicate_rooms(rooms)
+        # Prices can sit outside the room containers, so the text scan needs the whole page
+        if not full_page:
+            soup = BeautifulSoup(html, "lxml")
+        rooms = deduplicate_rooms(extract_rooms_from_text(soup, base))
     
     return rooms
 
-def extract_rooms_from_text(soup: BeautifulSoup, hotel: HotelInfo, date_str: str) -> list[RoomData]:
-    """Fallback: Extract room info from page text using regex patterns."""
+def extract_rooms_from_text(soup: BeautifulSoup, base: dict) -> list[RoomData]:
+    """Fallback: Extract room info from page text using regex patterns (base: see _room_base)."""
     rooms = []
     page_text = soup.get_text(' ', strip=True)
     
     # Look for room type patterns followed by prices
-    room_patterns = [
-        # "Deluxe Room ... ₹3,500" or "Deluxe Room ... R . 3,500"
-        r'((?:Deluxe|Standard|Superior|Premium|Executive|Family|Luxury|Suite|Studio|Twin|Double|Single|Queen|King)[\s\w\-]*(?:Room|Suite|Bed)?)\s*(?:.*?)(?:₹|R\s*\.)\s*([\d,]+)',
-    ]
-    
-    for pattern in room_patterns:
-        matches = re.findall(pattern, page_text, re.I)
-        for match in matches:
-            room_type = match[0].strip()
-            price_str = match[1].replace(',', '')
+    for match in _RE_ROOM_PRICE_LINE.finditer(page_text):
+        room_type = match.group('name').strip()
+        price_str = match.group('amt').replace(',', '')
+        
+        if not is_valid_room_name(room_type):
+            continue
             
-            if not is_valid_room_name(room_type):
-                continue
-                
-            try:
-                price = float(price_str)
-                if 1000 <= price <= 500000:  # Reasonable hotel price range
-                    rooms.append(RoomData(
-                        hotel_name=hotel.name,
-                        date=date_str,
-                        room_type=room_type,
-                        price=price,
-                        currency="INR",
-                        amenities=[],
-                        is_available=True,
-                        hotel_location=hotel.location,
-                        hotel_rating=hotel.rating,
-                        hotel_star_rating=hotel.star_rating,
-                        hotel_review_count=hotel.review_count,
-                    ))
-            except ValueError:
-                continue
+        try:
+            price = float(price_str)
+            if 1000 <= price <= 500000:  # Reasonable hotel price range
+                rooms.append(RoomData(
+                    **base,
+                    room_type=room_type,
+                    price=price,
+                    currency="INR",
+                    amenities=[],
+                    is_available=True,
+                ))
+        except ValueError:
+            continue
     
     return rooms
     
-def extract_room_data(room_elem, hotel: HotelInfo, date_str: str) -> Optional[RoomData]:
+def extract_room_data(room_elem, base: dict) -> Optional[RoomData]:
     """
     Extract room information from a room element.
     
     Args:
         room_elem: BeautifulSoup element representing a room
-        hotel: Hotel information object
-        date_str: Date string (YYYY-MM-DD)
+        base: Hotel/date fields for the RoomData, from _room_base
     
     Returns:
         RoomData object or None if extraction fails
     """
     try:
-        hotel_name = hotel.name
         room_text = room_elem.get_text(strip=True)
         
         # Skip flight/cross-sell elements - these contain flight prices, not room prices
-        elem_attrs = str(room_elem.attrs)
-        if any(x in elem_attrs.lower() for x in ['flight', 'cross-sell', 'airline', 'airport']):
+        if _is_flight(room_elem):
             logger.debug("Skipping flight/cross-sell element")
             return None
         
@@ -1273,30 +1842,14 @@ def extract_room_data(room_elem, hotel: HotelInfo, date_str: str) -> Optional[Ro
         
         # Extract room type/name
         room_type = None
-        name_selectors = [
-            {'tag': 'span', 'attrs': {'data-selenium': 'masterroom-title-name'}},
-            {'tag': 'span', 'attrs': {'data-selenium': 'room-name'}},
-            {'tag': 'h3', 'attrs': {'data-selenium': 'room-name'}},
-            {'tag': 'span', 'attrs': {'data-element-name': 'room-type-name'}},
-            {'tag': 'a', 'attrs': {'class': re.compile(r'room.*name', re.I)}},
-            {'tag': 'span', 'attrs': {'class': re.compile(r'room.*title|room.*name', re.I)}},
-            {'tag': 'div', 'attrs': {'data-selenium': re.compile(r'room.*name', re.I)}},
-        ]
-        
-        for selector in name_selectors:
-            elem = room_elem.find(selector['tag'], attrs=selector['attrs'])
-            if elem:
-                room_type = elem.get_text(strip=True)
-                break
+        for _, elems in _matches_by_rule(room_elem, *_NAME_RULES):
+            room_type = elems[0].get_text(strip=True)
+            break
         
         if not room_type:
             # Only accept room names that contain "Room" or "Suite" explicitly
             # This avoids extracting bed types like "king bed", "double bed"
-            room_match = re.search(
-                r'\b((?:Deluxe|Standard|Superior|Premium|Classic|Executive|Family|Luxury|Triple|Quad)[\s\-]*(?:Room|Suite)(?:\s+(?:King|Queen|Twin|Double))?)',
-                room_text,
-                re.I
-            )
+            room_match = _RE_ROOM_TYPE.search(room_text)
             if room_match:
                 room_type = room_match.group(1).strip()
         
@@ -1306,7 +1859,7 @@ def extract_room_data(room_elem, hotel: HotelInfo, date_str: str) -> Optional[Ro
             return None
         
         # Clean up room type
-        room_type = re.sub(r'\s+', ' ', room_type).strip()[:100]
+        room_type = _RE_WHITESPACE.sub(' ', room_type).strip()[:100]
         
         # Validate room name - reject if it's a UI element or garbage text
         if not is_valid_room_name(room_type):
@@ -1319,87 +1872,58 @@ def extract_room_data(room_elem, hotel: HotelInfo, date_str: str) -> Optional[Ro
         currency = "INR"
         
         # First try specific selectors (from browser inspection)
-        price_selectors = [
-            {'tag': 'strong', 'attrs': {'data-ppapi': 'room-price'}},  # Main price selector
-            {'tag': 'span', 'attrs': {'data-ppapi': 'room-price'}},
-            {'tag': 'span', 'attrs': {'data-selenium': 'display-price'}},
-            {'tag': 'span', 'attrs': {'class': re.compile(r'price.*amount|final.*price', re.I)}},
-            {'tag': 'div', 'attrs': {'data-element-name': 'final-price'}},
-            {'tag': 'span', 'attrs': {'class': re.compile(r'PropertyCardPrice', re.I)}},
-        ]
-        
-        for selector in price_selectors:
-            elem = room_elem.find(selector['tag'], attrs=selector['attrs'])
-            if elem:
-                price_text = elem.get_text(strip=True)
-                price = extract_price_value(price_text)
-                currency = extract_currency(price_text)
-                if price:
-                    break
+        for _, elems in _matches_by_rule(room_elem, *_PRICE_RULES):
+            price_text = elems[0].get_text(strip=True)
+            price = extract_price_value(price_text)
+            currency = extract_currency(price_text)
+            if price:
+                break
         
         # If no price found, try to extract from text using multiple patterns
         if not price:
-            # Price patterns observed: "R . 3,939" or "₹3,939" or "INR 3939"
-            price_patterns = [
-                r'R\s*\.?\s*([\d,]+)',  # "R . 3,939" or "R.3939"
-                r'₹\s*([\d,]+)',  # "₹3,939"
-                r'Rs\.?\s*([\d,]+)',  # "Rs. 3939"
-                r'INR\s*([\d,]+)',  # "INR 3939"
-            ]
-            
-            for pattern in price_patterns:
-                price_match = re.search(pattern, room_text)
-                if price_match:
-                    try:
-                        price = float(price_match.group(1).replace(',', '').replace('\xa0', ''))
-                        # Sanity check - hotel room prices typically 1000-500000 INR
-                        # 1000 INR minimum helps filter out flight prices
-                        if price >= 1000:
-                            break
-                        else:
-                            price = None  # Reset if too low
-                    except ValueError:
-                        pass
-        
-        # Check availability - look for specific sold out elements, not just text
-        is_available = True
-        
-        # Look for specific sold out elements
-        sold_out_elem = room_elem.find(attrs={'data-selenium': re.compile(r'sold.*out', re.I)})
-        if sold_out_elem:
-            is_available = False
-        
-        # Also check for explicit sold out text near price area
-        price_area = room_elem.find(attrs={'data-ppapi': 'room-price'}) or room_elem.find(class_=re.compile(r'price', re.I))
-        if price_area:
-            price_area_text = price_area.get_text(strip=True).lower()
-            if 'sold out' in price_area_text or 'unavailable' in price_area_text:
-                is_available = False
+            # One scan over the text; the first amount that looks like a room price wins
+            for price_match in _RE_PRICE_AMOUNT.finditer(room_text):
+                try:
+                    price = float(price_match.group('amt').replace(',', '').replace('\xa0', ''))
+                    # Sanity check - hotel room prices typically 1000-500000 INR
+                    # 1000 INR minimum helps filter out flight prices
+                    if price >= 1000:
+                        break
+                    else:
+                        price = None  # Reset if too low
+                except ValueError:
+                    pass
         
-        # If we have a valid price, the room is generally available
-        if price is not None and price > 0:
-            is_available = True
-        elif price is None:
-            is_available = False
+        # Check availability - a valid price means the room is bookable unless it is
+        # marked sold out (a sold-out data-selenium element, or sold-out text in the price area)
+        is_available = price is not None and price > 0
+        if is_available:
+            marker = _css(_SOLD_OUT_OR_PRICE_AREA).select_one(room_elem)
+            if marker is not None:
+                if _RE_SOLD_OUT.search(str(marker.get('data-selenium', ''))):
+                    is_available = False
+                else:
+                    marker_text = marker.get_text(strip=True).lower()
+                    if 'sold out' in marker_text or 'unavailable' in marker_text:
+                        is_available = False
         
         # Extract amenities
-        amenities = extract_amenities(room_elem)
+        amenities = extract_amenities(room_elem, text_lower)
         
         # Extract cancellation policy
-        cancellation_policy = extract_cancellation_policy(room_elem)
+        cancellation_policy = extract_cancellation_policy(room_elem, text_lower)
         
         # Extract meal plan
-        meal_plan = extract_meal_plan(room_elem)
+        meal_plan = extract_meal_plan(room_elem, text_lower)
         
         # Extract bed type
-        bed_type = extract_bed_type(room_elem)
+        bed_type = extract_bed_type(room_elem, text_lower)
         
         # Extract max occupancy
         max_occupancy = extract_occupancy(room_elem)
         
         return RoomData(
-            hotel_name=hotel_name,
-            date=date_str,
+            **base,
             room_type=room_type,
             price=price,
             currency=currency,
@@ -1409,10 +1933,6 @@ def extract_room_data(room_elem, hotel: HotelInfo, date_str: str) -> Optional[Ro
             meal_plan=meal_plan,
             bed_type=bed_type,
             max_occupancy=max_occupancy,
-            hotel_location=hotel.location,
-            hotel_rating=hotel.rating,
-            hotel_star_rating=hotel.star_rating,
-            hotel_review_count=hotel.review_count,
         )
         
     except Exception as e:
@@ -1420,18 +1940,28 @@ def extract_room_data(room_elem, hotel: HotelInfo, date_str: str) -> Optional[Ro
         return None
 
 
+def _is_flight(elem) -> bool:
+    """Check whether an element's attribute values mark it as a flight/cross-sell widget."""
+    values = []
+    for value in elem.attrs.values():
+        values.append(' '.join(value) if isinstance(value, list) else str(value))
+    attr_text = '|'.join(values).lower()
+    return any(token in attr_text for token in _FLIGHT_TOKENS)
+
+
 def extract_price_value(text: str) -> Optional[float]:
     """Extract numeric price value from text."""
     if not text:
         return None
     
     # Remove "R ." or "R." prefix (Agoda's INR format)
-    text = re.sub(r'R\s*\.?\s*', '', text)
+    if 'R' in text:
+        text = _RE_PRICE_PREFIX.sub('', text)
     # Remove currency symbols and formatting
-    text = re.sub(r'[₹$€£,\s\xa0]', '', text)
+    text = text.translate(_PRICE_STRIP_TABLE)
     
     # Find number - must start with a digit (not a dot)
-    match = re.search(r'\d[\d,]*\.?\d*', text)
+    match = _RE_PRICE_NUMBER.search(text)
     if match:
         try:
             price = float(match.group().replace(',', ''))
@@ -1446,19 +1976,25 @@ def extract_price_value(text: str) -> Optional[float]:
 
 def extract_currency(text: str) -> str:
     """Extract currency from price text."""
-    if '₹' in text or 'INR' in text:
-        return "INR"
-    elif '$' in text or 'USD' in text:
-        return "USD"
-    elif '€' in text or 'EUR' in text:
-        return "EUR"
-    elif '£' in text or 'GBP' in text:
-        return "GBP"
+    # One scan collects every marker; INR > USD > EUR > GBP when several appear
+    found = {_CURRENCY_MARKERS[m] for m in _RE_CURRENCY.findall(text)}
+    for currency in ("INR", "USD", "EUR", "GBP"):
+        if currency in found:
+            return currency
     return "INR"  # Default
 
 
-def extract_amenities(room_elem) -> list[str]:
-    """Extract room amenities from room element."""
+def extract_amenities(room_elem, room_text: Optional[str] = None) -> list[str]:
+    """
+    Extract room amenities from room element.
+    
+    Args:
+        room_elem: BeautifulSoup element representing a room
+        room_text: Lowercased room text if the caller already has it (saves a subtree walk)
+    
+    Returns:
+        Unique amenity names
+    """
     amenities = []
     
     # Safety check: if room_elem is None, return empty list
@@ -1466,63 +2002,28 @@ def extract_amenities(room_elem) -> list[str]:
         return amenities
     
     # Look for amenity-related elements
-    amenity_selectors = [
-        {'tag': 'span', 'attrs': {'class': re.compile(r'amenity|feature|benefit', re.I)}},
-        {'tag': 'li', 'attrs': {'class': re.compile(r'amenity|feature', re.I)}},
-        {'tag': 'div', 'attrs': {'data-element-name': re.compile(r'amenity|benefit', re.I)}},
-    ]
-    
-    for selector in amenity_selectors:
-        elems = room_elem.find_all(selector['tag'], attrs=selector['attrs'])
+    for _, elems in _matches_by_rule(room_elem, *_AMENITY_RULES):
         for elem in elems:
             text = elem.get_text(strip=True)
             if text and len(text) > 1 and len(text) < 100:
                 amenities.append(text)
     
     # Look for common amenity keywords in the room text
-    room_text = room_elem.get_text(strip=True).lower()
-    keyword_amenities = {
-        'wifi': 'WiFi',
-        'wi-fi': 'WiFi',
-        'breakfast': 'Breakfast',
-        'parking': 'Parking',
-        'pool': 'Pool Access',
-        'gym': 'Gym Access',
-        'spa': 'Spa Access',
-        'air condition': 'Air Conditioning',
-        'ac': 'Air Conditioning',
-        'minibar': 'Minibar',
-        'mini bar': 'Minibar',
-        'room service': 'Room Service',
-        'tv': 'TV',
-        'balcony': 'Balcony',
-        'sea view': 'Sea View',
-        'city view': 'City View',
-        'garden view': 'Garden View',
-    }
-    
-    for keyword, amenity_name in keyword_amenities.items():
-        if keyword in room_text and amenity_name not in amenities:
-            amenities.append(amenity_name)
+    if room_text is None:
+        room_text = room_elem.get_text(strip=True).lower()
+    amenities.extend(_KEYWORD_AMENITIES[m.group(1)] for m in _RE_AMENITY_KEYWORDS.finditer(room_text))
     
     return list(set(amenities))  # Remove duplicates
 
 
-def extract_cancellation_policy(room_elem) -> Optional[str]:
+def extract_cancellation_policy(room_elem, room_text: Optional[str] = None) -> Optional[str]:
     """Extract cancellation policy from room element."""
-    cancellation_selectors = [
-        {'tag': 'span', 'attrs': {'data-selenium': re.compile(r'cancellation', re.I)}},
-        {'tag': 'div', 'attrs': {'class': re.compile(r'cancellation|refund', re.I)}},
-        {'tag': 'span', 'attrs': {'class': re.compile(r'cancellation|refund', re.I)}},
-    ]
-    
-    for selector in cancellation_selectors:
-        elem = room_elem.find(selector['tag'], attrs=selector['attrs'])
-        if elem:
-            return elem.get_text(strip=True)
+    for _, elems in _matches_by_rule(room_elem, *_CANCEL_RULES):
+        return elems[0].get_text(strip=True)
     
     # Check for keywords
-    room_text = room_elem.get_text(strip=True).lower()
+    if room_text is None:
+        room_text = room_elem.get_text(strip=True).lower()
     if 'free cancellation' in room_text:
         return 'Free Cancellation'
     elif 'non-refundable' in room_text or 'nonrefundable' in room_text:
@@ -1533,19 +2034,13 @@ def extract_cancellation_policy(room_elem) -> Optional[str]:
     return None
 
 
-def extract_meal_plan(room_elem) -> Optional[str]:
+def extract_meal_plan(room_elem, room_text: Optional[str] = None) -> Optional[str]:
     """Extract meal plan from room element."""
-    meal_selectors = [
-        {'tag': 'span', 'attrs': {'data-element-name': re.compile(r'meal|breakfast|board', re.I)}},
-        {'tag': 'div', 'attrs': {'class': re.compile(r'meal|breakfast|board', re.I)}},
-    ]
-    
-    for selector in meal_selectors:
-        elem = room_elem.find(selector['tag'], attrs=selector['attrs'])
-        if elem:
-            return elem.get_text(strip=True)
+    for _, elems in _matches_by_rule(room_elem, *_MEAL_RULES):
+        return elems[0].get_text(strip=True)
     
-    room_text = room_elem.get_text(strip=True).lower()
+    if room_text is None:
+        room_text = room_elem.get_text(strip=True).lower()
     if 'breakfast included' in room_text:
         return 'Breakfast Included'
     elif 'half board' in room_text:
@@ -1560,21 +2055,14 @@ def extract_meal_plan(room_elem) -> Optional[str]:
     return None
 
 
-def extract_bed_type(room_elem) -> Optional[str]:
+def extract_bed_type(room_elem, room_text: Optional[str] = None) -> Optional[str]:
     """Extract bed type from room element."""
-    bed_selectors = [
-        {'tag': 'span', 'attrs': {'data-selenium': re.compile(r'bed', re.I)}},
-        {'tag': 'div', 'attrs': {'class': re.compile(r'bed.*type|bed.*info', re.I)}},
-    ]
-    
-    for selector in bed_selectors:
-        elem = room_elem.find(selector['tag'], attrs=selector['attrs'])
-        if elem:
-            return elem.get_text(strip=True)
-    
-    room_text = room_elem.get_text(strip=True).lower()
-    bed_types = ['king bed', 'queen bed', 'double bed', 'twin bed', 'single bed', 'sofa bed']
-    for bed in bed_types:
+    for _, elems in _matches_by_rule(room_elem, *_BED_RULES):
+        return elems[0].get_text(strip=True)
+    
+    if room_text is None:
+        room_text = room_elem.get_text(strip=True).lower()
+    for bed in _BED_TYPES:
         if bed in room_text:
             return bed.title()
     
@@ -1583,28 +2071,21 @@ def extract_bed_type(room_elem) -> Optional[str]:
 
 def extract_occupancy(room_elem) -> Optional[int]:
     """Extract maximum occupancy from room element."""
-    occ_selectors = [
-        {'tag': 'span', 'attrs': {'data-selenium': re.compile(r'occupancy|guest', re.I)}},
-        {'tag': 'div', 'attrs': {'class': re.compile(r'occupancy|capacity', re.I)}},
-    ]
-    
-    for selector in occ_selectors:
-        elem = room_elem.find(selector['tag'], attrs=selector['attrs'])
-        if elem:
-            text = elem.get_text(strip=True)
-            match = re.search(r'(\d+)', text)
-            if match:
-                return int(match.group(1))
+    for _, elems in _matches_by_rule(room_elem, *_OCC_RULES):
+        text = elems[0].get_text(strip=True)
+        match = _RE_DIGITS.search(text)
+        if match:
+            return int(match.group(1))
     
     return None
 
 
-def deduplicate_rooms(rooms: list[RoomData]) -> list[RoomData]:
+def deduplicate_rooms(rooms: Iterable[RoomData]) -> list[RoomData]:
     """
     Deduplicate rooms by room type, keeping the one with lowest price.
     
     Args:
-        rooms: List of RoomData objects
+        rooms: RoomData objects; any iterable, so a generator is reduced as it is produced
     
     Returns:
         Deduplicated list of RoomData objects
@@ -1613,17 +2094,16 @@ def deduplicate_rooms(rooms: list[RoomData]) -> list[RoomData]:
     
     for room in rooms:
         key = room.room_type
-        if key not in room_dict:
+        existing = room_dict.get(key)
+        if existing is None:
+            room_dict[key] = room
+            continue
+        # Missing prices rank as infinite, so any priced room beats an unpriced one
+        # and ties keep the first room seen
+        price = room.price if room.price is not None else math.inf
+        existing_price = existing.price if existing.price is not None else math.inf
+        if price < existing_price:
             room_dict[key] = room
-        else:
-            existing = room_dict[key]
-            # Keep the one with price if one doesn't have price
-            if existing.price is None and room.price is not None:
-                room_dict[key] = room
-            # Keep the one with lower price if both have prices
-            elif room.price is not None and existing.price is not None:
-                if room.price < existing.price:
-                    room_dict[key] = room
     
     return list(room_dict.values())
 
@@ -1654,23 +2134,83 @@ async def scrape_hotel_rooms_for_dates(
     if start_date is None:
         start_date = datetime.now() + timedelta(days=1)
     
-    all_rooms = []
+    # Every check-in date, built once up front
+    check_ins = [start_date + timedelta(days=day_offset) for day_offset in range(config.days_ahead)]
+    if not check_ins:
+        return []
+    rooms_by_date: dict[datetime, list[RoomData]] = {}
     
-    for day_offset in range(config.days_ahead):
-        check_in = start_date + timedelta(days=day_offset)
-        
-        logger.info(f"Scraping {hotel.name} for {check_in.date()} ({day_offset + 1}/{config.days_ahead})")
-        
-        rooms = await scrape_hotel_rooms(page, hotel, check_in, config, session_id=session_id)
-        all_rooms.extend(rooms)
-        
+    def record(check_in: datetime, rooms: list[RoomData]):
+        rooms_by_date[check_in] = rooms
         # Call callback to save rooms immediately after each date
         if on_rooms_scraped and rooms:
             on_rooms_scraped(rooms)
-        
+    
+    # Filled by the first date whose rooms came from the room API; later dates replay it
+    api_template = {}
+    
+    # The first date always goes through the page: it warms the cookies and captures the API request
+    logger.info(f"Scraping {hotel.name} for {check_ins[0].date()} (1/{len(check_ins)})")
+    record(check_ins[0], await scrape_hotel_rooms(
+        page, hotel, check_ins[0], config, session_id=session_id, api_template=api_template
+    ))
+    remaining = check_ins[1:]
+    
+    if api_template and remaining:
+        # Replay the API for the other dates over the context's shared HTTP connection pool
+        logger.info(f"Fetching {hotel.name} for {len(remaining)} more dates via the room API")
+        replayed = await fetch_many_via_api(
+            page.context.request,
+            api_template,
+            hotel,
+            remaining,
+            max(1, config.concurrency),
+            delay_range=config.delays.between_dates,
+            on_rooms_scraped=on_rooms_scraped,
+        )
+        for check_in, rooms in zip(remaining, replayed):
+            if rooms is not None:
+                rooms_by_date[check_in] = rooms
+        remaining = [check_in for check_in, rooms in zip(remaining, replayed) if rooms is None]
+        api_template.clear()  # it just failed for whatever is left
+        if remaining:
+            logger.info(f"{len(remaining)} dates of {hotel.name} fall back to page visits")
+    
+    if remaining and config.concurrency > 1:
+        # Scrape several dates at once on separate pages of the same context
+        await random_delay(*config.delays.between_dates)
+        jobs = [(hotel, check_in, config, session_id) for check_in in remaining]
+        logger.info(f"Scraping {hotel.name} for {len(jobs)} dates ({config.concurrency} at a time)")
+        # Rooms are handed to the callback as each date finishes; the stored results keep date order
+        results = await scrape_many(
+            page.context,
+            jobs,
+            config.concurrency,
+            on_rooms_scraped=on_rooms_scraped,
+            delay_range=config.delays.between_dates,
+        )
+        rooms_by_date.update(zip(remaining, results))
+        remaining = []
+    
+    for check_in in remaining:
         # Add delay between date requests
-        if day_offset < config.days_ahead - 1:
-            await random_delay(*config.delays.between_dates)
+        await random_delay(*config.delays.between_dates)
+        
+        logger.info(f"Scraping {hotel.name} for {check_in.date()} ({check_ins.index(check_in) + 1}/{len(check_ins)})")
+        
+        rooms = None
+        if api_template:
+            rooms = await fetch_rooms_via_api(page.context.request, api_template, hotel, check_in)
+            if rooms is None:
+                # Stale template; the page visit below captures a fresh one
+                api_template.clear()
+        if rooms is None:
+            rooms = await scrape_hotel_rooms(
+                page, hotel, check_in, config, session_id=session_id, api_template=api_template
+            )
+        record(check_in, rooms)
     
+    all_rooms = []
+    for check_in in check_ins:
+        all_rooms.extend(rooms_by_date.get(check_in, []))
     return all_rooms
-
@@ -1,12 +1,21 @@
 #!/usr/bin/env python3
 """Test script to verify JSON API interception and parsing."""
 
+import argparse
 import asyncio
 import logging
+import os
 from datetime import datetime, timedelta
+from typing import Optional
+from playwright.async_api import async_playwright
 from scraper.browser import BrowserManager
 from scraper.models import HotelInfo, ScraperConfig
-from scraper.room_details import scrape_hotel_rooms
+from scraper.room_details import (
+    scrape_hotel_rooms,
+    fetch_rooms_via_api,
+    save_api_template,
+    load_api_template,
+)
 
 # Setup logging
 logging.basicConfig(
@@ -15,10 +24,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Room API request captured by a browser run, replayed by --no-browser runs
+TEMPLATE_PATH = os.path.join("output", "api_samples", "room_api_template.json")
 
-async def test_json_scraper():
-    """Test the JSON API scraping approach on a single hotel."""
-    
+
+def make_test_setup() -> tuple[HotelInfo, ScraperConfig]:
+    """Hotel and configuration shared by the browser and --no-browser tests."""
     # Test hotel - Laxmi Palace Heritage Boutique Hotel in Jaipur
     test_hotel = HotelInfo(
         name="Laxmi Palace Heritage Boutique Hotel",
@@ -43,8 +54,81 @@ async def test_json_scraper():
             "between_dates": [0.5, 1.0],
             "scroll_pause": [0.3, 0.7]
         },
-        output_dir="output"
+        output_dir="output",
+        debug_html=True,  # Keep API samples for inspection
     )
+    return test_hotel, config
+
+
+def report_rooms(rooms: list, session_id: Optional[str] = None):
+    """
+    Log the scraped rooms and check them for the known failure modes.
+    
+    session_id names the API sample / debug HTML written by a browser run;
+    leave it out when nothing was written (--no-browser).
+    """
+    # Display results
+    logger.info("\n" + "=" * 80)
+    logger.info(f"✅ RESULTS: Found {len(rooms)} rooms")
+    logger.info("=" * 80)
+    
+    # Lazy %-style args, and skip the per-room loop entirely when INFO is filtered out
+    if logger.isEnabledFor(logging.INFO):
+        for i, room in enumerate(rooms, 1):
+            logger.info("\n📍 Room %d:", i)
+            logger.info("   Name: %s", room.room_type)
+            if room.price:
+                logger.info("   Price: ₹%s %s", room.price, room.currency)
+            else:
+                logger.info("   Price: Not Available")
+            logger.info("   Available: %s", room.is_available)
+            if room.bed_type:
+                logger.info("   Bed Type: %s", room.bed_type)
+            if room.meal_plan:
+                logger.info("   Meal Plan: %s", room.meal_plan)
+            if room.max_occupancy:
+                logger.info("   Max Occupancy: %s", room.max_occupancy)
+            if room.amenities:
+                logger.info("   Amenities: %s", ', '.join(room.amenities[:5]))
+                if len(room.amenities) > 5:
+                    logger.info("              ... and %d more", len(room.amenities) - 5)
+    
+    if session_id:
+        logger.info("\n" + "=" * 80)
+        logger.info("Check the following for debugging:")
+        logger.info(f"  - API sample JSON: output/api_samples/{session_id}_sample.json")
+        logger.info(f"  - Debug HTML: output/debug_html/{session_id}/")
+        logger.info("=" * 80)
+    
+    # Validate results
+    if rooms:
+        success = True
+        for room in rooms:
+            # Check if we got garbage room names (the old problem)
+            if "Free WiFi See details" in room.room_type:
+                logger.error(f"❌ FAILED: Still getting garbage room names: {room.room_type}")
+                success = False
+            elif room.room_type in ["No Rooms Found", "Error"]:
+                logger.warning(f"⚠️  WARNING: {room.room_type}")
+                success = False
+        
+        if success:
+            logger.info("\n✅ SUCCESS: JSON scraping is working correctly!")
+        else:
+            logger.warning("\n⚠️  Some issues detected - check logs above")
+    else:
+        logger.error("\n❌ FAILED: No rooms found")
+
+
+async def test_json_scraper(template_path: str = TEMPLATE_PATH, save_credentials: bool = False):
+    """
+    Test the JSON API scraping approach on a single hotel.
+    
+    The captured room API request is saved to template_path; the session cookies
+    and credential headers only with save_credentials.
+    """
+    
+    test_hotel, config = make_test_setup()
     
     logger.info("=" * 80)
     logger.info("Testing JSON API Scraper")
@@ -64,59 +148,25 @@ async def test_json_scraper():
         
         logger.info(f"\n🔍 Scraping for check-in date: {check_in.date()}")
         
+        api_template = {}
         rooms = await scrape_hotel_rooms(
             page=page,
             hotel=test_hotel,
             check_in=check_in,
             config=config,
-            session_id=session_id
+            session_id=session_id,
+            api_template=api_template,
         )
         
-        # Display results
-        logger.info("\n" + "=" * 80)
-        logger.info(f"✅ RESULTS: Found {len(rooms)} rooms")
-        logger.info("=" * 80)
-        
-        for i, room in enumerate(rooms, 1):
-            logger.info(f"\n📍 Room {i}:")
-            logger.info(f"   Name: {room.room_type}")
-            logger.info(f"   Price: ₹{room.price} {room.currency}" if room.price else "   Price: Not Available")
-            logger.info(f"   Available: {room.is_available}")
-            if room.bed_type:
-                logger.info(f"   Bed Type: {room.bed_type}")
-            if room.meal_plan:
-                logger.info(f"   Meal Plan: {room.meal_plan}")
-            if room.max_occupancy:
-                logger.info(f"   Max Occupancy: {room.max_occupancy}")
-            if room.amenities:
-                logger.info(f"   Amenities: {', '.join(room.amenities[:5])}")
-                if len(room.amenities) > 5:
-                    logger.info(f"              ... and {len(room.amenities) - 5} more")
-        
-        logger.info("\n" + "=" * 80)
-        logger.info("Check the following for debugging:")
-        logger.info(f"  - API sample JSON: output/api_samples/{session_id}_sample.json")
-        logger.info(f"  - Debug HTML: output/debug_html/{session_id}/")
-        logger.info("=" * 80)
+        report_rooms(rooms, session_id)
         
-        # Validate results
-        if rooms:
-            success = True
-            for room in rooms:
-                # Check if we got garbage room names (the old problem)
-                if "Free WiFi See details" in room.room_type:
-                    logger.error(f"❌ FAILED: Still getting garbage room names: {room.room_type}")
-                    success = False
-                elif room.room_type in ["No Rooms Found", "Error"]:
-                    logger.warning(f"⚠️  WARNING: {room.room_type}")
-                    success = False
-            
-            if success:
-                logger.info("\n✅ SUCCESS: JSON scraping is working correctly!")
-            else:
-                logger.warning("\n⚠️  Some issues detected - check logs above")
-        else:
-            logger.error("\n❌ FAILED: No rooms found")
+        # Keep the room API request for --no-browser runs; cookies only on explicit opt-in
+        if api_template:
+            storage_state = await page.context.storage_state() if save_credentials else None
+            await asyncio.to_thread(save_api_template, template_path, api_template, storage_state)
+            logger.info(f"Saved room API template to {template_path}")
+            if save_credentials:
+                logger.warning(f"⚠️  {template_path} contains session cookies in plaintext - don't share it")
         
     except Exception as e:
         logger.error(f"\n❌ ERROR: {e}", exc_info=True)
@@ -125,5 +175,52 @@ async def test_json_scraper():
         await browser_manager.close()
 
 
+async def test_json_api_only(template_path: str = TEMPLATE_PATH):
+    """Replay a saved room API request for the same hotel without launching a browser."""
+    test_hotel, _ = make_test_setup()
+    
+    try:
+        template, storage_state = await asyncio.to_thread(load_api_template, template_path)
+    except FileNotFoundError:
+        logger.error(f"❌ No API template at {template_path} - run once without --no-browser first")
+        return
+    
+    if storage_state is None:
+        logger.warning("Template has no saved cookies (record it with --save-credentials); the API may refuse the request")
+    
+    check_in = datetime.now() + timedelta(days=1)
+    logger.info(f"\n🔍 Fetching {test_hotel.name} for {check_in.date()} via the room API (no browser)")
+    
+    async with async_playwright() as p:
+        request_context = await p.request.new_context(storage_state=storage_state)
+        try:
+            rooms = await fetch_rooms_via_api(request_context, template, test_hotel, check_in)
+        finally:
+            await request_context.dispose()
+    
+    if rooms is None:
+        logger.error("❌ API replay failed - the template/cookies may be stale, rerun with a browser")
+        return
+    report_rooms(rooms)
+
+
 if __name__ == "__main__":
-    asyncio.run(test_json_scraper())
+    parser = argparse.ArgumentParser(description="Test JSON API interception and parsing")
+    parser.add_argument(
+        "--no-browser",
+        action="store_true",
+        help="Replay the room API request saved by a previous browser run instead of opening a browser",
+    )
+    parser.add_argument("--template", default=TEMPLATE_PATH, help="Path of the saved room API template")
+    parser.add_argument(
+        "--save-credentials",
+        action="store_true",
+        help="Also save the session cookies and credential headers with the template "
+             "(plaintext; needed for --no-browser if the API requires a session)",
+    )
+    args = parser.parse_args()
+    
+    if args.no_browser:
+        asyncio.run(test_json_api_only(args.template))
+    else:
+        asyncio.run(test_json_scraper(args.template, save_credentials=args.save_credentials))